@@ -1,6 +1,9 @@
 """
 ACO Algoritması Parametre Ayarları
 """
+import json
+import os
+
 # ACO Algoritma Parametreleri
 DEFAULT_ALPHA = 1.0  # Feromon önem katsayısı
 DEFAULT_BETA = 2.0  # Mesafe önem katsayısı
@@ -8,6 +11,66 @@ DEFAULT_EVAPORATION_RATE = 0.5  # Feromon buharlaşma oranı
 DEFAULT_Q = 100  # Feromon miktarı sabiti
 DEFAULT_ANT_COUNT = 50  # Karınca sayısı
 DEFAULT_ITERATIONS = 100  # İterasyon sayısı
+DEFAULT_VARIANT = 'as'  # ACO varyantı: 'as', 'acs', 'mmas', 'rank'
+ACO_VARIANTS = ('as', 'acs', 'mmas', 'rank')
+
+# Varyanta özel önerilen parametreler (verilmeyenler genel varsayılanlardan gelir);
+# MMAS ve sıralama tabanlı AS düşük buharlaşmayla, ACS yerel güncellemeyle birlikte
+# düşük buharlaşmayla en iyi sonucu verir
+VARIANT_DEFAULTS = {
+    'as': {},
+    'acs': {'DEFAULT_EVAPORATION_RATE': 0.1, 'DEFAULT_BETA': 3.0},
+    'mmas': {'DEFAULT_EVAPORATION_RATE': 0.1, 'DEFAULT_BETA': 3.0},
+    'rank': {'DEFAULT_EVAPORATION_RATE': 0.1, 'DEFAULT_BETA': 5.0},
+}
+
+# Kenar çubuğu kaydırıcı aralıkları: ayar adı -> (alt, üst, adım)
+PARAMETER_RANGES = {
+    'DEFAULT_ANT_COUNT': (10, 200, 10),
+    'DEFAULT_ITERATIONS': (10, 500, 10),
+    'DEFAULT_ALPHA': (0.1, 5.0, 0.1),
+    'DEFAULT_BETA': (0.1, 5.0, 0.1),
+    'DEFAULT_EVAPORATION_RATE': (0.1, 0.9, 0.05),
+}
+
+# Düşük Bellek Modu
+LOW_MEMORY_THRESHOLD = 5000  # Bu nokta sayısının üstünde float32 matrisler kullanılır
+LOW_MEMORY_CHUNK_SIZE = 1024  # Matris oluştururken satır parçası boyutu
+DEFAULT_CANDIDATE_K = 20  # Seyrek feromon için en yakın komşu (aday) sayısı
+
+# Sonuç Önbelleği
+RESULT_STORE_PATH = 'results.db'  # Çözüm önbelleği (SQLite)
+RESULT_STORE_MAX_ENTRIES = 500  # Önbellekte tutulacak en fazla çalıştırma
+
+# Arka Plan İşleri
+JOB_WORKERS = None  # Eşzamanlı iş sayısı (None ise CPU sayısı)
+JOB_POLL_INTERVAL = 0.5  # İlerleme güncelleme aralığı (saniye)
+
+# Kesin Çözüm (Held-Karp)
+EXACT_MAX_CITIES = 21  # Bu şehir sayısına kadar (depo dahil) ACO yerine kesin çözüm kullanılır
+EXACT_MEMORY_LIMIT_MB = 512  # Held-Karp tabloları için bellek sınırı
+
+# Alt Sınır ve Açık Garantili Durdurma
+LOWER_BOUND_ITERATIONS = 200  # Held-Karp alt gradyan iterasyonu
+DEFAULT_TARGET_GAP = None  # Örn. 0.02: en iyi tur alt sınırın %2 yakınına gelince dur
+
+# Kontrol Noktaları
+CHECKPOINT_DIR = 'checkpoints'  # Uzun çalıştırmaların durum dosyaları
+CHECKPOINT_EVERY = 10  # Kaç iterasyonda bir durum kaydedileceği
+
+# Artımlı Yeniden Optimizasyon
+INCREMENTAL_WINDOW = 10  # Değişen durağın iki yanında yerel aramaya giren durak sayısı
+INCREMENTAL_TIME_LIMIT = 1.0  # Yerel arama süre sınırı (saniye)
+
+# Görselleştirme
+CONVERGENCE_MAX_POINTS = 400  # Yakınsama grafiğinde ekrana çizilecek en fazla nokta (LTTB)
+CONVERGENCE_EXPORT_PATH = 'figure/convergence.png'  # Dışa aktarılan grafik dosyası
+
+# Adres Çözümleme (Geocoding)
+GEOCODE_CACHE_PATH = 'geocode_cache.db'  # Adres -> koordinat önbelleği (SQLite)
+GEOCODE_WORKERS = 8  # Eşzamanlı adres çözümleme isteği
+GEOCODE_RATE_LIMIT = 40  # Saniyedeki en fazla istek
+GEOCODE_MAX_RETRIES = 3  # Hata veren istek için yeniden deneme sayısı
 
 # Google Maps API Ayarları
 GOOGLE_MAPS_API_KEY = None  # .streamlit/secrets.toml veya .env'den yüklenecek
@@ -16,3 +79,61 @@ GOOGLE_MAPS_API_KEY = None  # .streamlit/secrets.toml veya .env'den yüklenecek
 GOOGLE_DRIVE_FOLDER_ID = "1X6f9c4m4p-50gFVcmxLHYfnhHe5tJFbT"
 
 
+
+def clamp_tuned_defaults(values):
+    """
+    Ayarlanmış varsayılanları kenar çubuğu aralıklarına uydurur
+
+    Bilinmeyen ayarlar ve geçersiz varyantlar atılır; sayısal değerler
+    aralığa sıkıştırılıp kaydırıcı adımına yuvarlanır ve aralık sınırlarının
+    tipine (int/float) çevrilir (Streamlit aralık dışı veya farklı tipte
+    varsayılan değerde hata verir).
+
+    Args:
+        values: Ayar adı -> değer sözlüğü
+
+    Returns:
+        dict: Geçerli ayarlar
+    """
+    clamped = {}
+    for name, value in values.items():
+        if name == 'DEFAULT_VARIANT':
+            if value in ACO_VARIANTS:
+                clamped[name] = value
+            continue
+        if name not in PARAMETER_RANGES or isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        low, high, step = PARAMETER_RANGES[name]
+        steps = round((min(max(value, low), high) - low) / step)
+        value = min(low + steps * step, high)
+        clamped[name] = type(low)(round(value, 6))
+    return clamped
+
+
+def variant_defaults(variant):
+    """
+    Bir varyantın kenar çubuğu parametreleri
+
+    Args:
+        variant: 'as', 'acs', 'mmas' veya 'rank'
+
+    Returns:
+        dict: Ayar adı -> değer (VARIANT_DEFAULTS, yoksa genel varsayılan)
+    """
+    overrides = VARIANT_DEFAULTS.get(variant, {})
+    return {name: overrides.get(name, globals()[name]) for name in PARAMETER_RANGES}
+
+
+# Ayarlama sonucu (core/tuning.py) kaydedilmişse varsayılanların üzerine yaz
+_TUNED_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tuned_config.json')
+if os.path.exists(_TUNED_CONFIG_PATH):
+    with open(_TUNED_CONFIG_PATH, encoding='utf-8') as _f:
+        _tuned = clamp_tuned_defaults(json.load(_f))
+    globals().update(_tuned)
+    # Ayarlanan değerler, ayarlandıkları varyantın önerilerinden önce gelir
+    VARIANT_DEFAULTS[DEFAULT_VARIANT] = dict(
+        VARIANT_DEFAULTS.get(DEFAULT_VARIANT, {}),
+        **{name: value for name, value in _tuned.items() if name in PARAMETER_RANGES}
+    )
+
+
@@ -2,8 +2,18 @@
 Karınca Kolonisi Optimizasyonu (ACO) Algoritması
 TSP (Traveling Salesman Problem) için uygulama
 """
+import json
+import os
 import numpy as np
 import random
+from core.pheromone import DensePheromone, SparsePheromone
+from core.sampling import RouletteSampler, make_sampler
+from core.distance_oracle import DistanceOracle
+from core.exact import can_solve_exact, held_karp
+from core.lower_bound import held_karp_bound, optimality_gap
+from core.tour_utils import tour_distance
+from core.variants import make_variant
+from core import numba_backend
 
 class AntColonyOptimizer:
     """
@@ -11,18 +21,52 @@ class AntColonyOptimizer:
     """
     
     def __init__(self, distance_matrix, n_ants=50, n_iterations=100, 
-                 alpha=1.0, beta=2.0, evaporation_rate=0.5, q=100):
+                 alpha=1.0, beta=2.0, evaporation_rate=0.5, q=100,
+                 low_memory=False, candidate_k=None, sampler='roulette', seed=None,
+                 backend='auto', variant='as', variant_params=None, verbose=True,
+                 exact_threshold=None, target_gap=None):
         """
         Args:
-            distance_matrix: Mesafe matrisi (n x n)
+            distance_matrix: Mesafe matrisi (n x n, np.memmap olabilir) veya
+                DistanceOracle (matris oluşturulmaz, aday listeleri zorunlu)
             n_ants: Karınca sayısı
             n_iterations: İterasyon sayısı
             alpha: Feromon önem katsayısı
             beta: Mesafe önem katsayısı
             evaporation_rate: Feromon buharlaşma oranı
             q: Feromon miktarı sabiti
+            low_memory: True ise matrisler float32 tutulur ve verilen matris
+                kopyalanmaz (float32 memmap doğrudan kullanılır)
+            candidate_k: Verilirse feromon sadece k-en yakın aday kenarlarda
+                seyrek olarak saklanır (buharlaşma/bırakma O(n·k)) ve karıncalar
+                sadece adaylar arasından seçer (iterasyon başına O(m·n·k))
+            sampler: Sonraki şehir seçim yöntemi ('roulette' veya 'gumbel';
+                'gumbel' tüm karıncaları aynı anda vektörel olarak ilerletir)
+            seed: Rastgele sayı üreteci tohumu (aynı tohum aynı sonucu verir)
+            backend: 'numpy', 'numba' veya 'auto' (Numba yüklüyse ve rulet
+                örnekleyici ile yoğun feromon kullanılıyorsa derlenmiş çekirdekler)
+            variant: ACO varyantı ('as', 'acs', 'mmas', 'rank' veya strateji nesnesi)
+            variant_params: Varyant parametreleri (ör. {'q0': 0.9})
+            verbose: False ise ilerleme bilgisi yazdırılmaz
+            exact_threshold: Bu şehir sayısına kadar ACO yerine Held-Karp ile
+                kesin çözüm (None ise config.EXACT_MAX_CITIES, 0 ise kapalı)
+            target_gap: Verilirse Held-Karp alt sınırı hesaplanır ve en iyi tur
+                sınıra bu oranda yaklaşınca durulur (ör. 0.02 = %2; 0 ise
+                sadece açık raporlanır). Düşük bellek, aday listesi ve mesafe
+                kahini modlarında alt sınır hesaplanmaz.
         """
-        self.distance_matrix = np.array(distance_matrix)
+        self.low_memory = low_memory
+        self.dtype = np.float32 if low_memory else np.float64
+        
+        # Mesafe kahini: mesafeler istek üzerine hesaplanır, n x n matris yok
+        self.oracle_mode = isinstance(distance_matrix, DistanceOracle)
+        if self.oracle_mode:
+            self.distance_matrix = distance_matrix
+        elif low_memory:
+            # Savunmacı kopya yok: uygun dtype'taki dizi/memmap olduğu gibi kullanılır
+            self.distance_matrix = np.asarray(distance_matrix, dtype=self.dtype)
+        else:
+            self.distance_matrix = np.array(distance_matrix)
         self.n_cities = len(distance_matrix)
         self.n_ants = n_ants
         self.n_iterations = n_iterations
@@ -30,9 +74,39 @@ class AntColonyOptimizer:
         self.beta = beta
         self.evaporation_rate = evaporation_rate
         self.q = q
+        self.verbose = verbose
+        if exact_threshold is None:
+            from config import EXACT_MAX_CITIES
+            exact_threshold = EXACT_MAX_CITIES
+        self.exact_threshold = exact_threshold
+        if target_gap is None:
+            from config import DEFAULT_TARGET_GAP
+            target_gap = DEFAULT_TARGET_GAP
+        self.target_gap = target_gap
+        
+        # Optimizer'a özel rastgele sayı üreteci ve örnekleyici
+        self.rng = np.random.default_rng(seed)
+        self.sampler = make_sampler(sampler, self.rng)
+        
+        # Feromon (başlangıçta küçük bir değer)
+        if self.oracle_mode and candidate_k is None:
+            from config import DEFAULT_CANDIDATE_K
+            candidate_k = DEFAULT_CANDIDATE_K
+        self.candidate_k = candidate_k
+        if self.oracle_mode:
+            # Adaylar mekânsal indeksten gelir; yoğun feromon bu ölçekte tutulamaz
+            self.candidates = self.distance_matrix.candidate_lists(candidate_k)
+            self.pheromone = SparsePheromone(self.candidates, 0.1, dtype=self.dtype)
+        elif candidate_k is not None and candidate_k < self.n_cities - 1:
+            from core.candidates import build_candidate_lists
+            self.candidates = build_candidate_lists(self.distance_matrix, candidate_k)
+            self.pheromone = SparsePheromone(self.candidates, 0.1, dtype=self.dtype)
+        else:
+            self.candidates = None
+            self.pheromone = DensePheromone(self.n_cities, 0.1, dtype=self.dtype)
         
-        # Feromon matrisi (başlangıçta küçük bir değer)
-        self.pheromone = np.ones((self.n_cities, self.n_cities)) * 0.1
+        self.backend = self._resolve_backend(backend)
+        self.variant = make_variant(variant, **(variant_params or {}))
         
         # En iyi çözüm
         self.best_path = None
@@ -40,7 +114,75 @@ class AntColonyOptimizer:
         
         # İterasyon geçmişi (görselleştirme için)
         self.iteration_distances = []
+        self.iteration = 0
+        
+        # Alt sınır ve garanti edilen optimallik açığı (target_gap verildiyse)
+        self.lower_bound = None
+        self.gap = None
+        
+        # Son çalıştırmada kullanılan yöntem: 'exact' (Held-Karp) veya 'aco'
+        self.method = None
+    
+    @classmethod
+    def from_stores(cls, stores, oracle=False, **kwargs):
+        """
+        Mağaza kümesinden Haversine mesafe matrisiyle optimizer oluşturur
+        
+        Args:
+            stores: StoreSet veya (n, 2) koordinat dizisi
+            oracle: True ise matris yerine DistanceOracle kullanılır
+                (on binlerce durak için)
+            **kwargs: AntColonyOptimizer parametreleri
+        
+        Returns:
+            AntColonyOptimizer: Optimizer nesnesi
+        """
+        if oracle:
+            return cls(DistanceOracle(stores), **kwargs)
+        
+        from config import LOW_MEMORY_CHUNK_SIZE
+        from core.haversine import haversine_matrix
+        from data.store_set import as_coordinate_array
         
+        if kwargs.get('low_memory'):
+            distance_matrix = haversine_matrix(as_coordinate_array(stores), dtype=np.float32,
+                                               chunk_size=LOW_MEMORY_CHUNK_SIZE)
+        else:
+            distance_matrix = haversine_matrix(as_coordinate_array(stores))
+        np.fill_diagonal(distance_matrix, 0.0)
+        return cls(distance_matrix, **kwargs)
+    
+    def _resolve_backend(self, backend):
+        """İstenen hesaplama altyapısını kontrol eder ve seçer"""
+        if backend not in ('auto', 'numpy', 'numba'):
+            raise ValueError(f"Bilinmeyen altyapı: {backend} (seçenekler: auto, numpy, numba)")
+        
+        supported = (isinstance(self.sampler, RouletteSampler)
+                     and isinstance(self.pheromone, DensePheromone)
+                     and isinstance(self.distance_matrix, np.ndarray))
+        
+        if backend == 'numba':
+            if not numba_backend.NUMBA_AVAILABLE:
+                raise ImportError("Numba kütüphanesi yüklü değil")
+            if not supported:
+                raise ValueError("Numba altyapısı sadece rulet örnekleyici ve yoğun feromonla kullanılabilir")
+            return 'numba'
+        
+        if backend == 'auto' and numba_backend.NUMBA_AVAILABLE and supported:
+            return 'numba'
+        return 'numpy'
+    
+    def _attractiveness(self, current_city, unvisited_cities):
+        """Normalize edilmemiş seçim ağırlıkları: τ^α · (1/d)^β"""
+        # Sadece mevcut satır okunur; n x n türetilmiş matris oluşturulmaz
+        pheromone_values = self.pheromone.row(current_city, unvisited_cities).astype(np.float64) ** self.alpha
+        
+        # Mesafe değeri (küçük mesafe = yüksek tercih)
+        distances = self.distance_matrix[current_city, unvisited_cities].astype(np.float64)
+        distance_values = (1.0 / (distances + 1e-10)) ** self.beta
+        
+        return pheromone_values * distance_values
+    
     def calculate_probability(self, current_city, unvisited_cities):
         """
         Bir sonraki şehir seçme olasılıklarını hesaplar
@@ -55,16 +197,7 @@ class AntColonyOptimizer:
         if len(unvisited_cities) == 0:
             return np.array([])
         
-        probabilities = np.zeros(len(unvisited_cities))
-        
-        for idx, city in enumerate(unvisited_cities):
-            # Feromon değeri
-            pheromone_value = self.pheromone[current_city, city] ** self.alpha
-            
-            # Mesafe değeri (küçük mesafe = yüksek tercih)
-            distance_value = (1.0 / (self.distance_matrix[current_city, city] + 1e-10)) ** self.beta
-            
-            probabilities[idx] = pheromone_value * distance_value
+        probabilities = self._attractiveness(current_city, unvisited_cities)
         
         # Normalize et
         total = np.sum(probabilities)
@@ -86,13 +219,12 @@ class AntColonyOptimizer:
         Returns:
             int: Seçilen şehir indeksi
         """
-        probabilities = self.calculate_probability(current_city, unvisited_cities)
-        
-        if len(probabilities) == 0:
+        if len(unvisited_cities) == 0:
             return None
         
-        # Rastgele seçim (olasılıklara göre)
-        return np.random.choice(unvisited_cities, p=probabilities)
+        # Rastgele seçim (ağırlıklara göre, optimizer'ın üreteciyle)
+        weights = self._attractiveness(current_city, unvisited_cities)
+        return unvisited_cities[self.sampler.select(weights)]
     
     def construct_solution(self, start_city=0):
         """
@@ -105,6 +237,9 @@ class AntColonyOptimizer:
             list: Şehir ziyaret sırası
             float: Toplam mesafe
         """
+        if self.candidates is not None:
+            return self._construct_candidate_solution(start_city)
+        
         path = [start_city]
         unvisited = list(range(self.n_cities))
         unvisited.remove(start_city)
@@ -112,22 +247,156 @@ class AntColonyOptimizer:
         
         # Tüm şehirleri ziyaret et
         while len(unvisited) > 0:
-            next_city = self.select_next_city(current_city, unvisited)
-            if next_city is None:
+            weights = self._attractiveness(current_city, unvisited)
+            next_city = unvisited.pop(self.variant.choose(self, weights))
+            self.variant.local_update(self, current_city, next_city)
+            path.append(next_city)
+            current_city = next_city
+        
+        # Depoya geri dön
+        path.append(start_city)
+        
+        return path, self.path_distance(path)
+    
+    def _construct_candidate_solution(self, start_city=0):
+        """
+        Aday listeleriyle çözüm oluşturur (candidate_k veya mesafe kahini modu)
+        
+        Her adımda sadece ziyaret edilmemiş aday komşular arasından seçim
+        yapılır; tüm adaylar ziyaret edildiyse en yakın ziyaret edilmemiş
+        şehre gidilir. Adım maliyeti n yerine k ile orantılıdır.
+        
+        Args:
+            start_city: Başlangıç şehri indeksi (depo)
+        
+        Returns:
+            list: Şehir ziyaret sırası
+            float: Toplam mesafe
+        """
+        visited = np.zeros(self.n_cities, dtype=bool)
+        # Ziyaret edilmemiş şehirler: ilk 'remaining' eleman, çıkarma son elemanla yer değiştirerek
+        unvisited = np.arange(self.n_cities)
+        position = np.arange(self.n_cities)
+        remaining = self.n_cities
+        
+        path = [start_city]
+        current_city = start_city
+        while True:
+            visited[current_city] = True
+            idx = position[current_city]
+            last = unvisited[remaining - 1]
+            unvisited[idx] = last
+            position[last] = idx
+            remaining -= 1
+            if remaining == 0:
                 break
+            
+            options = self.candidates[current_city]
+            options = options[~visited[options]]
+            if len(options):
+                weights = self._attractiveness(current_city, options)
+                next_city = int(options[self.variant.choose(self, weights)])
+            else:
+                rest = unvisited[:remaining]
+                next_city = int(rest[np.argmin(self.distance_matrix[current_city, rest])])
+            
+            self.variant.local_update(self, current_city, next_city)
             path.append(next_city)
-            unvisited.remove(next_city)
             current_city = next_city
         
         # Depoya geri dön
         path.append(start_city)
         
-        # Toplam mesafeyi hesapla
-        total_distance = 0
-        for i in range(len(path) - 1):
-            total_distance += self.distance_matrix[path[i], path[i + 1]]
+        return path, self.path_distance(path)
+    
+    def construct_solutions(self, n_ants, start_city=0):
+        """
+        Tüm karıncalar için çözümleri aynı anda (vektörel) oluşturur
+        
+        Her adımda tüm karıncaların log-ağırlıkları tek matriste hesaplanır
+        ve örnekleyicinin toplu seçimiyle bir sonraki şehirler belirlenir.
         
-        return path, total_distance
+        Args:
+            n_ants: Karınca sayısı
+            start_city: Başlangıç şehri indeksi (depo)
+        
+        Returns:
+            list: Her karınca için şehir ziyaret sırası
+            list: Her karınca için toplam mesafe
+        """
+        ants = np.arange(n_ants)
+        paths = np.empty((n_ants, self.n_cities + 1), dtype=np.intp)
+        paths[:, 0] = start_city
+        paths[:, -1] = start_city
+        
+        visited = np.zeros((n_ants, self.n_cities), dtype=bool)
+        visited[:, start_city] = True
+        current = paths[:, 0].copy()
+        
+        for step in range(1, self.n_cities):
+            with np.errstate(divide='ignore'):
+                log_weights = (self.alpha * np.log(self.pheromone.rows(current).astype(np.float64))
+                               - self.beta * np.log(self.distance_matrix[current].astype(np.float64) + 1e-10))
+            log_weights[visited] = -np.inf
+            
+            # Feromonu tamamen sönmüş satırlarda ziyaret edilmemişler arasında düzgün seçim
+            dead = ~np.isfinite(log_weights.max(axis=1))
+            if np.any(dead):
+                log_weights[dead] = np.where(visited[dead], -np.inf, 0.0)
+            
+            current = self.sampler.select_log_batch(log_weights)
+            visited[ants, current] = True
+            paths[:, step] = current
+        
+        distances = self.distance_matrix[paths[:, :-1], paths[:, 1:]].sum(axis=1, dtype=np.float64)
+        return paths.tolist(), distances.tolist()
+    
+    def path_distance(self, path):
+        """
+        Bir yolun toplam mesafesini hesaplar
+        
+        Args:
+            path: Şehir ziyaret sırası
+        
+        Returns:
+            float: Toplam mesafe
+        """
+        return tour_distance(self.distance_matrix, path)
+    
+    def _construct_iteration(self, start_city):
+        """Bir iterasyondaki tüm karıncaların yollarını ve mesafelerini üretir"""
+        constructed = self.variant.construct_iteration(self, start_city)
+        if constructed is not None:
+            return constructed
+        
+        if self.variant.custom_construction:
+            # Varyanta özel seçim/yerel güncelleme: karıncalar sırayla ilerler
+            paths, distances = [], []
+            for ant in range(self.n_ants):
+                path, distance = self.construct_solution(start_city)
+                paths.append(path)
+                distances.append(distance)
+            return paths, distances
+        
+        if self.backend == 'numba':
+            uniforms = self.sampler.take(self.n_ants * (self.n_cities - 1))
+            paths = numba_backend.construct_tours(
+                self.distance_matrix, self.pheromone.values, float(self.alpha), float(self.beta),
+                start_city, self.n_ants, uniforms
+            )
+            distances = numba_backend.evaluate_tours(self.distance_matrix, paths)
+            return paths.tolist(), distances.tolist()
+        
+        # Aday listeleri varken karıncalar sırayla ilerler (adım başına O(k))
+        if self.sampler.batched and self.candidates is None:
+            return self.construct_solutions(self.n_ants, start_city)
+        
+        paths, distances = [], []
+        for ant in range(self.n_ants):
+            path, distance = self.construct_solution(start_city)
+            paths.append(path)
+            distances.append(distance)
+        return paths, distances
     
     def update_pheromone(self, paths, distances):
         """
@@ -137,53 +406,197 @@ class AntColonyOptimizer:
             paths: Tüm karıncaların yolları
             distances: Tüm karıncaların mesafeleri
         """
+        if self.backend == 'numba':
+            dtype = self.pheromone.values.dtype.type
+            deposits = np.array([self.q / distance if distance > 0 else 0.0 for distance in distances],
+                                dtype=self.pheromone.values.dtype)
+            numba_backend.update_pheromone_dense(
+                self.pheromone.values, dtype(1 - self.evaporation_rate),
+                np.asarray(paths, dtype=np.int64), deposits
+            )
+            return
+        
         # Buharlaşma
-        self.pheromone *= (1 - self.evaporation_rate)
+        self.pheromone.evaporate(self.evaporation_rate)
         
         # Her karınca için feromon bırakma
         for path, distance in zip(paths, distances):
             if distance > 0:
-                pheromone_deposit = self.q / distance
-                for i in range(len(path) - 1):
-                    self.pheromone[path[i], path[i + 1]] += pheromone_deposit
+                self.pheromone.deposit(path, self.q / distance)
     
-    def solve(self, start_city=0):
+    def save_checkpoint(self, path, start_city=0):
+        """
+        Optimizer durumunu sıkıştırılmış .npz dosyasına yazar
+        
+        Feromon, en iyi çözüm, iterasyon geçmişi ve sayacı, varyant durumu,
+        rastgele sayı üreteci ve örnekleyicinin önceden ürettiği sayılar
+        saklanır; kaldığı yerden devam eden çalıştırma kesintisiz
+        çalıştırmayla bit düzeyinde aynı sonucu verir. Dosya önce geçici
+        isimle yazılıp yer değiştirilir (yarım kalan yazma eskisini bozmaz).
+        
+        Args:
+            path: Dosya yolu
+            start_city: Başlangıç şehri indeksi
+        """
+        meta = {
+            'n_cities': self.n_cities,
+            'start_city': start_city,
+            'iteration': self.iteration,
+            'variant': self.variant.name,
+            'variant_state': self.variant.get_state(),
+            'rng_state': self.rng.bit_generator.state,
+            'best_path': None if self.best_path is None else [int(city) for city in self.best_path],
+            'best_distance': float(self.best_distance),
+            'iteration_distances': [float(d) for d in self.iteration_distances],
+        }
+        arrays = {f'pheromone_{name}': value for name, value in self.pheromone.get_state().items()}
+        arrays.update({f'sampler_{name}': value for name, value in self.sampler.get_state().items()})
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(temp_path, path)
+    
+    def load_checkpoint(self, path, start_city=0):
+        """
+        save_checkpoint ile yazılmış durumu geri yükler
+        
+        Args:
+            path: Dosya yolu
+            start_city: Başlangıç şehri indeksi (kayıttakiyle aynı olmalı)
+        
+        Returns:
+            int: Kaydedilen iterasyon sayısı
+        """
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            pheromone_state = {name[len('pheromone_'):]: data[name] for name in data.files
+                               if name.startswith('pheromone_')}
+            sampler_state = {name[len('sampler_'):]: data[name] for name in data.files
+                             if name.startswith('sampler_')}
+        
+        if meta['n_cities'] != self.n_cities or meta['start_city'] != start_city:
+            raise ValueError(f"Kontrol noktası bu problemle uyumsuz: {path}")
+        if pheromone_state['values'].shape != self.pheromone.values.shape:
+            raise ValueError(f"Kontrol noktasındaki feromon boyutu uyumsuz: {path}")
+        
+        if meta['variant'] != self.variant.name:
+            self.variant = make_variant(meta['variant'])
+        self.variant.set_state(meta['variant_state'])
+        self.pheromone.set_state(pheromone_state)
+        self.sampler.set_state(sampler_state)
+        self.rng.bit_generator.state = meta['rng_state']
+        self.best_path = meta['best_path']
+        self.best_distance = meta['best_distance']
+        self.iteration_distances = meta['iteration_distances']
+        self.iteration = meta['iteration']
+        return self.iteration
+    
+    def solve(self, start_city=0, variant=None, callback=None, checkpoint_path=None,
+              checkpoint_every=None, resume=False, **variant_params):
         """
         ACO algoritmasını çalıştırır
         
         Args:
             start_city: Başlangıç şehri indeksi (depo)
+            variant: Verilirse bu çalıştırma için ACO varyantı ('as', 'acs', 'mmas', 'rank')
+            callback: Her iterasyon sonunda callback(iteration, optimizer) çağrılır;
+                False döndürürse çalıştırma o ana kadarki en iyi sonuçla durur.
+                Kesin çözümde başta (iterasyon 0) ve sonda (iterasyon 1) çağrılır.
+            checkpoint_path: Verilirse durum periyodik olarak bu dosyaya kaydedilir
+            checkpoint_every: Kaç iterasyonda bir kaydedileceği
+                (None ise config.CHECKPOINT_EVERY)
+            resume: True ise ve kontrol noktası varsa çalıştırma kaldığı yerden sürer
+            **variant_params: Varyant parametreleri
         
         Returns:
             list: En iyi yol
             float: En iyi mesafe
             list: İterasyon geçmişi
+            
+            Kullanılan yöntem self.method ('exact' veya 'aco') özelliğinde;
+            target_gap verildiyse alt sınır self.lower_bound, garanti edilen
+            açık self.gap özelliklerinde raporlanır.
         """
-        for iteration in range(self.n_iterations):
+        if variant is not None:
+            self.variant = make_variant(variant, **variant_params)
+        if checkpoint_path is not None and checkpoint_every is None:
+            from config import CHECKPOINT_EVERY
+            checkpoint_every = CHECKPOINT_EVERY
+        
+        # Küçük örnekler kesin çözülür (bellek sınırı aşılıyorsa ACO'ya dönülür)
+        if (not self.oracle_mode and self.exact_threshold
+                and can_solve_exact(self.n_cities, self.exact_threshold)):
+            self.method = 'exact'
+            # İlerleme izleyicileri kesin çözümün başladığını görür (kesilemez, dönüş değeri yok sayılır)
+            if callback is not None:
+                callback(0, self)
+            self.best_path, self.best_distance = held_karp(self.distance_matrix, start_city)
+            self.iteration_distances = [self.best_distance]
+            self.iteration = 1
+            self.lower_bound = self.best_distance
+            self.gap = 0.0
+            if self.verbose:
+                print(f"Kesin çözüm (Held-Karp): {self.best_distance:.2f} km")
+            if callback is not None:
+                callback(1, self)
+            return self.best_path, self.best_distance, self.iteration_distances
+        self.method = 'aco'
+        
+        if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+            start_iteration = self.load_checkpoint(checkpoint_path, start_city)
+        else:
+            start_iteration = 0
+            self.variant.initialize(self, start_city)
+        
+        # Alt sınır iterasyon başına O(n^2) sürer: büyük örneklerin modlarında atlanır
+        if self.target_gap is not None:
+            if self.candidates is None and not self.low_memory:
+                self.lower_bound = held_karp_bound(self.distance_matrix)
+                if self.verbose:
+                    print(f"Alt sınır (Held-Karp): {self.lower_bound:.2f} km")
+            elif self.verbose:
+                print("Alt sınır düşük bellek/aday listesi modunda hesaplanmaz; açık raporlanmayacak")
+        
+        for iteration in range(start_iteration, self.n_iterations):
             # Tüm karıncalar için çözüm oluştur
-            paths = []
-            distances = []
+            paths, distances = self._construct_iteration(start_city)
             
-            for ant in range(self.n_ants):
-                path, distance = self.construct_solution(start_city)
-                paths.append(path)
-                distances.append(distance)
-                
+            for path, distance in zip(paths, distances):
                 # En iyi çözümü güncelle
                 if distance < self.best_distance:
                     self.best_distance = distance
                     self.best_path = path.copy()
             
             # Feromon güncelle
-            self.update_pheromone(paths, distances)
+            self.variant.update(self, paths, distances)
             
             # İterasyon geçmişi
             iteration_best = min(distances)
             self.iteration_distances.append(iteration_best)
+            self.iteration = iteration + 1
+            if self.lower_bound is not None:
+                self.gap = optimality_gap(self.best_distance, self.lower_bound)
             
             # İlerleme bilgisi (her 10 iterasyonda bir)
-            if (iteration + 1) % 10 == 0:
+            if self.verbose and (iteration + 1) % 10 == 0:
                 print(f"İterasyon {iteration + 1}/{self.n_iterations}: En iyi mesafe = {self.best_distance:.2f} km")
+            
+            if checkpoint_path is not None and (self.iteration % checkpoint_every == 0
+                                                or self.iteration == self.n_iterations):
+                self.save_checkpoint(checkpoint_path, start_city)
+            
+            if callback is not None and callback(iteration + 1, self) is False:
+                break
+            
+            # En iyi tur alt sınıra yeterince yakınsa dur
+            if self.gap is not None and self.gap <= self.target_gap:
+                if self.verbose:
+                    print(f"Hedef açığa ulaşıldı: %{self.gap * 100:.2f} (iterasyon {iteration + 1})")
+                break
         
         return self.best_path, self.best_distance, self.iteration_distances
 
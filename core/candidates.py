@@ -0,0 +1,34 @@
+"""
+Aday (k-en yakın komşu) grafiği oluşturma
+Büyük örneklerde karıncaların ve feromonun sadece yakın kenarlarla çalışması için
+"""
+import numpy as np
+
+
+def build_candidate_lists(distance_matrix, k, chunk_size=1024):
+    """
+    Her nokta için en yakın k komşuyu bulur
+    
+    Args:
+        distance_matrix: Mesafe matrisi (n x n, np.memmap olabilir)
+        k: Komşu sayısı
+        chunk_size: Aynı anda işlenen satır sayısı
+    
+    Returns:
+        numpy.ndarray: (n, k) komşu indeksleri, her satır indekse göre sıralı
+    """
+    n = len(distance_matrix)
+    k = min(k, n - 1)
+    candidates = np.empty((n, k), dtype=np.intp)
+    
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        rows = np.array(distance_matrix[start:stop], dtype=np.float64)
+        
+        # Noktanın kendisi aday olmasın
+        rows[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        
+        nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+        candidates[start:stop] = np.sort(nearest, axis=1)
+    
+    return candidates
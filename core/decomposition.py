@@ -0,0 +1,247 @@
+"""
+Önce kümele, sonra rotala: çok büyük mağaza kümeleri için ayrıştırma
+Mağazalar mekânsal olarak bölünür, her kümenin alt turu paralel olarak mevcut
+optimizer ile çözülür, turlar birleştirilip küme sınırlarında 2-opt ile onarılır
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.distance_oracle import DistanceOracle
+from core.haversine import haversine_matrix
+from core.tour_utils import tour_distance, two_opt_window
+from data.store_set import as_coordinate_array
+
+
+def _planar(coords):
+    """Enlem/boylamı kümeleme için yaklaşık düzlemsel koordinatlara çevirir"""
+    planar = np.empty_like(coords)
+    planar[:, 0] = coords[:, 0]
+    planar[:, 1] = coords[:, 1] * np.cos(np.radians(coords[:, 0].mean()))
+    return planar
+
+
+def kmeans_partition(coords, n_clusters, seed=None, n_iter=50):
+    """
+    K-means (k-means++ başlangıçlı) ile noktaları kümelere ayırır
+
+    Args:
+        coords: (n, 2) enlem/boylam dizisi
+        n_clusters: Küme sayısı
+        seed: Rastgele sayı üreteci tohumu
+        n_iter: En fazla Lloyd iterasyonu
+
+    Returns:
+        numpy.ndarray: (n,) küme etiketleri
+    """
+    rng = np.random.default_rng(seed)
+    points = _planar(coords)
+    n = len(points)
+
+    # k-means++ başlangıç merkezleri
+    centers = np.empty((n_clusters, 2))
+    centers[0] = points[rng.integers(n)]
+    closest = ((points - centers[0]) ** 2).sum(axis=1)
+    for c in range(1, n_clusters):
+        total = closest.sum()
+        idx = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centers[c] = points[idx]
+        closest = np.minimum(closest, ((points - centers[c]) ** 2).sum(axis=1))
+
+    labels = None
+    for iteration in range(n_iter):
+        sq_dist = ((points[:, np.newaxis, :] - centers[np.newaxis, :, :]) ** 2).sum(axis=2)
+        new_labels = np.argmin(sq_dist, axis=1)
+        if labels is not None and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for c in range(n_clusters):
+            members = points[labels == c]
+            if len(members):
+                centers[c] = members.mean(axis=0)
+
+    return _compact_labels(labels)
+
+
+def grid_partition(coords, n_clusters):
+    """
+    Sınırlayıcı kutuyu yaklaşık n_clusters hücreli ızgaraya böler
+
+    Args:
+        coords: (n, 2) enlem/boylam dizisi
+        n_clusters: Hedef hücre sayısı
+
+    Returns:
+        numpy.ndarray: (n,) küme etiketleri (boş hücreler atlanır)
+    """
+    points = _planar(coords)
+    side = max(1, int(np.ceil(np.sqrt(n_clusters))))
+    low = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - low, 1e-12)
+    cells = np.minimum(((points - low) / span * side).astype(np.intp), side - 1)
+    return _compact_labels(cells[:, 0] * side + cells[:, 1])
+
+
+def _compact_labels(labels):
+    """Etiketleri boşluksuz 0..k-1 aralığına çevirir"""
+    _, compact = np.unique(labels, return_inverse=True)
+    return compact.ravel()
+
+
+def _solve_cluster(task):
+    """Bir kümenin alt turunu çözer (worker içinde)"""
+    coords, start, params, seed = task
+    if len(coords) <= 3:
+        order = [start] + [i for i in range(len(coords)) if i != start]
+        return order + [start]
+
+    distance_matrix = haversine_matrix(coords)
+    np.fill_diagonal(distance_matrix, 0.0)
+    optimizer = AntColonyOptimizer(distance_matrix, seed=seed, verbose=False, **params)
+    best_path, _, _ = optimizer.solve(start_city=start)
+
+    # Alt tur tam pencereli 2-opt ile yerel optimuma getirilir
+    best_path = np.asarray(best_path, dtype=np.intp)
+    while two_opt_window(best_path, distance_matrix, 0, len(best_path) - 1):
+        pass
+    return best_path.tolist()
+
+
+class DecompositionSolver:
+    """
+    Önce kümele, sonra rotala çözücüsü
+
+    Mağazalar k-means veya ızgara ile kümelere ayrılır, küme merkezleri
+    üzerinden bir ziyaret sırası belirlenir, her kümenin alt turu süreç
+    havuzunda AntColonyOptimizer ile çözülür. Alt turlar, bir önceki
+    kümeden girişi ve bir sonraki kümeye çıkışı en ucuz olacak şekilde
+    döndürülüp birleştirilir. Alt turlar ve birleşik tur 2-opt ile yerel
+    optimuma getirilir.
+    Tam n x n matris oluşturulmaz (en büyük matris küme boyutundadır).
+    """
+
+    def __init__(self, stores, cluster_size=150, n_clusters=None, method='kmeans',
+                 n_workers=None, seed=None, repair_window=20, **optimizer_params):
+        """
+        Args:
+            stores: StoreSet veya (n, 2) koordinat dizisi
+            cluster_size: Hedef küme boyutu (n_clusters verilmezse kullanılır)
+            n_clusters: Küme sayısı
+            method: 'kmeans' veya 'grid'
+            n_workers: Süreç sayısı (None ise CPU sayısı)
+            seed: Rastgele sayı üreteci tohumu
+            repair_window: Sınır onarımında her yöndeki nokta sayısı (tüm tur
+                taramasında pencere adımı)
+            **optimizer_params: Küme çözümleri için AntColonyOptimizer parametreleri
+        """
+        if method not in ('kmeans', 'grid'):
+            raise ValueError(f"Bilinmeyen bölme yöntemi: {method} (seçenekler: kmeans, grid)")
+
+        self.coords = as_coordinate_array(stores)
+        n = len(self.coords)
+        self.n_clusters = n_clusters or max(1, int(np.ceil(n / cluster_size)))
+        self.method = method
+        self.n_workers = n_workers
+        self.seed = seed
+        self.repair_window = repair_window
+        self.optimizer_params = optimizer_params
+        self.labels = None
+
+    def _cluster_order(self, labels, start_city):
+        """Küme merkezleri üzerinde en yakın komşu sırası (depo kümesiyle başlar)"""
+        n_clusters = labels.max() + 1
+        centers = np.array([self.coords[labels == c].mean(axis=0) for c in range(n_clusters)])
+        order = [int(labels[start_city])]
+        remaining = set(range(n_clusters)) - set(order)
+        while remaining:
+            candidates = np.array(sorted(remaining))
+            dist = haversine_matrix(centers[[order[-1]]], centers[candidates])[0]
+            nxt = int(candidates[np.argmin(dist)])
+            order.append(nxt)
+            remaining.remove(nxt)
+        return order, centers
+
+    def _orient(self, cycle, previous, target):
+        """
+        Döngüyü önceki noktadan girip hedefe en yakın yerden çıkacak şekilde açar
+
+        Args:
+            cycle: Küme turu (global indeksler, kapanış hariç)
+            previous: Bir önceki ziyaret edilen nokta
+            target: Sonraki kümenin merkezi (koordinat)
+
+        Returns:
+            list: Açılmış yol
+        """
+        cycle = np.asarray(cycle)
+        entry_cost = haversine_matrix(self.coords[[previous]], self.coords[cycle])[0]
+        exit_cost = haversine_matrix(target[np.newaxis, :], self.coords[cycle])[0]
+
+        # İleri yön: cycle[k] ile gir, cycle[k-1] ile çık; geri yön: cycle[k] ile gir, cycle[k+1] ile çık
+        forward = entry_cost + np.roll(exit_cost, 1)
+        backward = entry_cost + np.roll(exit_cost, -1)
+        k_forward, k_backward = int(np.argmin(forward)), int(np.argmin(backward))
+
+        if forward[k_forward] <= backward[k_backward]:
+            return np.roll(cycle, -k_forward).tolist()
+        return np.roll(cycle[::-1], -(len(cycle) - 1 - k_backward)).tolist()
+
+    def solve(self, start_city=0):
+        """
+        Ayrıştırma çözümünü çalıştırır
+
+        Args:
+            start_city: Başlangıç şehri indeksi (depo)
+
+        Returns:
+            list: Tur (depoda başlar ve biter)
+            float: Toplam mesafe (km)
+        """
+        if self.method == 'kmeans':
+            labels = kmeans_partition(self.coords, self.n_clusters, seed=self.seed)
+        else:
+            labels = grid_partition(self.coords, self.n_clusters)
+        self.labels = labels
+
+        order, centers = self._cluster_order(labels, start_city)
+        members = [np.flatnonzero(labels == c) for c in order]
+
+        # Alt turlar paralel olarak çözülür
+        tasks = []
+        for idx, cluster in enumerate(members):
+            local_start = int(np.flatnonzero(cluster == start_city)[0]) if idx == 0 else 0
+            seed = None if self.seed is None else self.seed + idx
+            tasks.append((self.coords[cluster], local_start, self.optimizer_params, seed))
+        with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+            local_paths = list(pool.map(_solve_cluster, tasks))
+
+        # Birleştirme: depo kümesi depodan başlar, diğerleri uygun yönde açılır
+        path = [int(v) for v in members[0][local_paths[0][:-1]]]
+        boundaries = []
+        for idx in range(1, len(members)):
+            cycle = members[idx][local_paths[idx][:-1]]
+            target = centers[order[idx + 1]] if idx + 1 < len(order) else self.coords[start_city]
+            boundaries.append(len(path))
+            path.extend(self._orient(cycle, path[-1], target))
+        path.append(start_city)
+
+        # Küme sınırlarında 2-opt onarımı (iyileşme kalmayana kadar)
+        oracle = DistanceOracle(self.coords)
+        path = np.asarray(path, dtype=np.intp)
+        for boundary in boundaries + [len(path) - 1]:
+            lo = max(0, boundary - self.repair_window)
+            hi = min(len(path) - 1, boundary + self.repair_window)
+            while two_opt_window(path, oracle, lo, hi):
+                pass
+
+        # Birleşik turun tamamı örtüşen pencerelerle taranır (iyileşme kalmayana kadar)
+        step = max(1, self.repair_window)
+        improved = True
+        while improved:
+            improved = False
+            for lo in range(0, len(path) - 1, step):
+                improved |= two_opt_window(path, oracle, lo, min(len(path) - 1, lo + 2 * step))
+
+        best_path = path.tolist()
+        return best_path, tour_distance(oracle, best_path)
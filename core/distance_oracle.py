@@ -0,0 +1,164 @@
+"""
+Matris oluşturmadan mesafe hesaplama (mesafe kahini)
+Haversine mesafeleri istendiğinde hesaplanır, sık kullanılan satırlar küçük bir
+önbellekte tutulur; en yakın komşu adayları mekânsal indeksten (KD-ağacı/ızgara) gelir
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from core.haversine import haversine_distance, haversine_matrix
+from data.store_set import as_coordinate_array
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+
+def _unit_vectors(coords):
+    """Enlem/boylamı birim küre üzerindeki 3B noktalara çevirir (kiriş mesafesi büyük daire mesafesiyle monoton)"""
+    lat = np.radians(coords[:, 0])
+    lon = np.radians(coords[:, 1])
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def _grid_knn(points, k):
+    """
+    Düzgün 3B ızgara ile kesin k-en yakın komşu araması
+
+    Aynı hücredeki noktalar birlikte işlenir: hücre etrafındaki küp, k'ıncı
+    komşu mesafesi küpün iç yarıçapından küçük olana kadar büyütülür.
+    """
+    n = len(points)
+    low = points.min(axis=0)
+    spans = np.sort(points.max(axis=0) - low)[::-1]
+    area = max(spans[0] * max(spans[1], 1e-12), 1e-24)
+    cell = max(np.sqrt(area * max(k, 8) / n), 1e-12)
+
+    cells = np.floor((points - low) / cell).astype(np.int64)
+    order = np.lexsort((cells[:, 2], cells[:, 1], cells[:, 0]))
+    keys, starts, counts = np.unique(cells[order], axis=0, return_index=True, return_counts=True)
+    buckets = {tuple(key): order[start:start + count] for key, start, count in zip(keys, starts, counts)}
+
+    neighbors = np.empty((n, k), dtype=np.intp)
+    for key, members in buckets.items():
+        radius = 1
+        while True:
+            offsets = range(-radius, radius + 1)
+            candidates = np.concatenate([
+                buckets[(key[0] + dx, key[1] + dy, key[2] + dz)]
+                for dx in offsets for dy in offsets for dz in offsets
+                if (key[0] + dx, key[1] + dy, key[2] + dz) in buckets
+            ])
+            if len(candidates) > k:
+                sq_dist = ((points[members, np.newaxis, :] - points[np.newaxis, candidates, :]) ** 2).sum(axis=2)
+                sq_dist[candidates[np.newaxis, :] == members[:, np.newaxis]] = np.inf
+                nearest = np.argpartition(sq_dist, k - 1, axis=1)[:, :k]
+                kth = np.take_along_axis(sq_dist, nearest, axis=1).max()
+                # Küp dışındaki noktalar en az radius * cell uzaklıkta
+                if kth <= (radius * cell) ** 2 or len(candidates) == n:
+                    neighbors[members] = candidates[nearest]
+                    break
+            radius += 1
+    return neighbors
+
+
+class DistanceOracle:
+    """
+    Matris benzeri, istek üzerine Haversine mesafe kahini
+
+    oracle[i] satırı, oracle[i, j] tek/çoklu hedefleri, oracle[a, b] eşleşen
+    dizileri ve oracle[rows] satır bloklarını döndürür; böylece
+    AntColonyOptimizer n x n matris oluşturmadan çalışabilir.
+    """
+
+    def __init__(self, stores, cache_rows=256):
+        """
+        Args:
+            stores: StoreSet veya (n, 2) koordinat dizisi
+            cache_rows: Önbellekte tutulacak en fazla satır sayısı
+        """
+        self.coords = as_coordinate_array(stores)
+        self.cache_rows = cache_rows
+        self._rows = OrderedDict()
+        self.dtype = np.dtype(np.float64)
+
+    def __len__(self):
+        return len(self.coords)
+
+    @property
+    def shape(self):
+        return (len(self.coords), len(self.coords))
+
+    @property
+    def ndim(self):
+        return 2
+
+    def row(self, i):
+        """
+        Bir noktadan tüm noktalara mesafeler (LRU önbellekli)
+
+        Args:
+            i: Nokta indeksi
+
+        Returns:
+            numpy.ndarray: (n,) mesafeler (km)
+        """
+        i = int(i)
+        cached = self._rows.get(i)
+        if cached is not None:
+            self._rows.move_to_end(i)
+            return cached
+        values = haversine_matrix(self.coords[i:i + 1], self.coords)[0]
+        values[i] = 0.0
+        self._rows[i] = values
+        if len(self._rows) > self.cache_rows:
+            self._rows.popitem(last=False)
+        return values
+
+    def pairs(self, sources, targets):
+        """Eşleşen kaynak/hedef çiftleri arasındaki mesafeler"""
+        a = self.coords[sources]
+        b = self.coords[targets]
+        return haversine_distance((a[..., 0], a[..., 1]), (b[..., 0], b[..., 1]))
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            rows, cols = key
+            if np.ndim(rows) == 0:
+                cols = np.asarray(cols, dtype=np.intp) if not isinstance(cols, slice) else cols
+                # Satır önbellekteyse veya hedefler satırın büyük kısmıysa tüm satır kullanılır
+                if int(rows) in self._rows or isinstance(cols, slice) or np.size(cols) > len(self) // 8:
+                    return self.row(rows)[cols]
+                return self.pairs(np.full(np.shape(cols), int(rows)), cols)
+            return self.pairs(np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))
+
+        if np.ndim(key) == 0 and not isinstance(key, slice):
+            return self.row(key)
+        return haversine_matrix(self.coords[key], self.coords)
+
+    def candidate_lists(self, k):
+        """
+        Mekânsal indeksle her nokta için en yakın k komşuyu bulur
+
+        scipy varsa KD-ağacı, yoksa 3B ızgara kullanılır; ikisi de birim küre
+        üzerinde kiriş mesafesiyle çalışır ve büyük daire sıralamasıyla aynıdır.
+
+        Args:
+            k: Komşu sayısı
+
+        Returns:
+            numpy.ndarray: (n, k) komşu indeksleri, her satır indekse göre sıralı
+        """
+        k = min(k, len(self) - 1)
+        points = _unit_vectors(self.coords)
+        if cKDTree is not None:
+            _, neighbors = cKDTree(points).query(points, k=k + 1)
+            # Noktanın kendisini çıkar (çakışan noktalarda kendisi dönmediyse son komşuyu)
+            keep = neighbors != np.arange(len(self))[:, np.newaxis]
+            keep[keep.all(axis=1), -1] = False
+            neighbors = neighbors[keep].reshape(len(self), k).astype(np.intp)
+        else:
+            neighbors = _grid_knn(points, k)
+        return np.sort(neighbors, axis=1)
@@ -0,0 +1,142 @@
+"""
+Küçük örnekler için kesin çözüm (Held-Karp dinamik programlama)
+Alt kümeler bit maskesiyle temsil edilir; tablolar Numba yüklüyse derlenmiş
+döngülerle, değilse aynı büyüklükteki alt kümeler birlikte vektörel doldurulur
+"""
+from math import comb
+
+import numpy as np
+
+from core import numba_backend
+
+
+def held_karp_memory(n_cities):
+    """
+    Held-Karp tablolarının yaklaşık bellek ihtiyacı
+
+    Args:
+        n_cities: Şehir sayısı (depo dahil)
+
+    Returns:
+        int: Bayt
+    """
+    m = max(n_cities - 1, 0)
+    # Maliyet tablosu (float64) + önceki şehir tablosu (int8) + en büyük katmandaki ara diziler
+    return (1 << m) * m * 9 + comb(m, m // 2) * m * 16
+
+
+def can_solve_exact(n_cities, max_cities=None, memory_limit_mb=None):
+    """
+    Örneğin kesin çözücüyle çözülüp çözülemeyeceğini kontrol eder
+
+    Args:
+        n_cities: Şehir sayısı
+        max_cities: Boyut eşiği (None ise config.EXACT_MAX_CITIES)
+        memory_limit_mb: Bellek sınırı (None ise config.EXACT_MEMORY_LIMIT_MB)
+
+    Returns:
+        bool: Boyut ve bellek sınırları içindeyse True
+    """
+    from config import EXACT_MAX_CITIES, EXACT_MEMORY_LIMIT_MB
+
+    max_cities = EXACT_MAX_CITIES if max_cities is None else max_cities
+    memory_limit_mb = EXACT_MEMORY_LIMIT_MB if memory_limit_mb is None else memory_limit_mb
+    return n_cities <= max_cities and held_karp_memory(n_cities) <= memory_limit_mb * 1024 ** 2
+
+
+def _held_karp_tables(between, first):
+    """
+    Held-Karp tablolarını NumPy ile doldurur (Numba yoksa)
+
+    Aynı büyüklükteki tüm alt kümeler birlikte işlenir: cost[S, j] =
+    min_k cost[S - {j}, k] + d[k, j].
+
+    Args:
+        between: Depo dışındaki şehirler arası mesafeler (m x m)
+        first: Depodan her şehre mesafe (m,)
+
+    Returns:
+        numpy.ndarray: (2^m, m) maliyet tablosu
+        numpy.ndarray: (2^m, m) önceki şehir tablosu (int8)
+    """
+    m = len(first)
+    n_masks = 1 << m
+    cost = np.full((n_masks, m), np.inf)
+    parent = np.full((n_masks, m), -1, dtype=np.int8)
+    cost[1 << np.arange(m), np.arange(m)] = first
+
+    # Maskeler eleman sayısına göre katmanlara ayrılır
+    masks = np.arange(n_masks)
+    popcount = np.zeros(n_masks, dtype=np.int8)
+    for bit in range(m):
+        popcount += (masks >> bit) & 1
+    order = np.argsort(popcount, kind='stable')
+    boundaries = np.searchsorted(popcount[order], np.arange(m + 2))
+
+    for size in range(2, m + 1):
+        layer = order[boundaries[size]:boundaries[size + 1]]
+        for j in range(m):
+            subsets = layer[(layer >> j) & 1 == 1]
+            # j'den önceki son şehir k: cost[S - {j}, k] + d[k, j]
+            candidates = cost[subsets ^ (1 << j)] + between[:, j]
+            best = np.argmin(candidates, axis=1)
+            cost[subsets, j] = candidates[np.arange(len(subsets)), best]
+            parent[subsets, j] = best
+    return cost, parent
+
+
+def held_karp(distance_matrix, start_city=0, memory_limit_mb=None):
+    """
+    Held-Karp ile en kısa turu kesin olarak bulur
+
+    cost[S, j]: depodan çıkıp S kümesindeki şehirleri gezerek j'de biten en
+    kısa yol. Zaman O(2^n · n^2), bellek O(2^n · n); asimetrik matrislerle de
+    çalışır.
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n)
+        start_city: Başlangıç şehri indeksi (depo)
+        memory_limit_mb: Bellek sınırı (None ise config.EXACT_MEMORY_LIMIT_MB)
+
+    Returns:
+        list: En kısa tur (depoda başlar ve biter)
+        float: Toplam mesafe
+    """
+    from config import EXACT_MEMORY_LIMIT_MB
+
+    distance_matrix = np.asarray(distance_matrix, dtype=np.float64)
+    n = len(distance_matrix)
+    memory_limit_mb = EXACT_MEMORY_LIMIT_MB if memory_limit_mb is None else memory_limit_mb
+    if held_karp_memory(n) > memory_limit_mb * 1024 ** 2:
+        raise MemoryError(f"Held-Karp {n} şehir için yaklaşık {held_karp_memory(n) / 1024 ** 2:.0f} MB "
+                          f"gerektirir (sınır {memory_limit_mb} MB)")
+
+    others = np.array([city for city in range(n) if city != start_city], dtype=np.intp)
+    m = len(others)
+    if m <= 1:
+        path = [start_city] + others.tolist() + [start_city]
+        return path, float(distance_matrix[path[:-1], path[1:]].sum())
+
+    between = distance_matrix[np.ix_(others, others)]
+    first = distance_matrix[start_city, others]
+    if numba_backend.NUMBA_AVAILABLE:
+        cost, parent = numba_backend.held_karp_tables(between, first)
+    else:
+        cost, parent = _held_karp_tables(between, first)
+
+    full = (1 << m) - 1
+    totals = cost[full] + distance_matrix[others, start_city]
+    last = int(np.argmin(totals))
+    best_distance = float(totals[last])
+
+    # Geriye doğru yolu çıkar
+    order_back = []
+    mask = full
+    while last >= 0:
+        order_back.append(int(others[last]))
+        previous = int(parent[mask, last])
+        mask ^= 1 << last
+        last = previous
+
+    path = [start_city] + order_back[::-1] + [start_city]
+    return path, best_distance
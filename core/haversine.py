@@ -40,3 +40,58 @@ def haversine_distance(coord1, coord2):
     return distance
 
 
+
+def haversine_matrix(coords_a, coords_b=None, dtype=np.float64, out=None, chunk_size=None,
+                     should_stop=None):
+    """
+    İki koordinat dizisi arasındaki tüm mesafeleri vektörel olarak hesaplar
+    
+    Args:
+        coords_a: (n, 2) enlem/boylam dizisi
+        coords_b: (m, 2) enlem/boylam dizisi (None ise coords_a kullanılır)
+        dtype: Çıktı veri tipi (düşük bellek için np.float32)
+        out: Sonucun yazılacağı (n, m) dizi (ör. np.memmap)
+        chunk_size: Satır parçası boyutu; verilirse ara diziler parça boyutunda kalır
+        should_stop: Parçalar arasında çağrılır; True dönerse hesaplama
+            durdurulur ve None döner
+    
+    Returns:
+        numpy.ndarray: (n, m) mesafe matrisi (kilometre cinsinden, durdurulduysa None)
+    """
+    coords_a = np.asarray(coords_a, dtype=np.float64)
+    coords_b = coords_a if coords_b is None else np.asarray(coords_b, dtype=np.float64)
+    
+    if out is None and chunk_size is None:
+        return _haversine_block(coords_a, coords_b).astype(dtype, copy=False)
+    
+    if out is None:
+        out = np.empty((len(coords_a), len(coords_b)), dtype=dtype)
+    if chunk_size is None:
+        chunk_size = len(coords_a)
+    
+    # Satır parçaları halinde doldur (float64 ara dizi sadece parça boyutunda)
+    for start in range(0, len(coords_a), chunk_size):
+        if should_stop is not None and should_stop():
+            return None
+        stop = min(start + chunk_size, len(coords_a))
+        out[start:stop] = _haversine_block(coords_a[start:stop], coords_b)
+    
+    return out
+
+def _haversine_block(coords_a, coords_b):
+    """haversine_matrix için tek bloğun float64 hesaplaması"""
+    R = 6371.0
+    
+    coords_a = np.radians(coords_a)
+    coords_b = np.radians(coords_b)
+    
+    lat1 = coords_a[:, 0][:, np.newaxis]
+    lon1 = coords_a[:, 1][:, np.newaxis]
+    lat2 = coords_b[:, 0][np.newaxis, :]
+    lon2 = coords_b[:, 1][np.newaxis, :]
+    
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    a = np.clip(a, 0.0, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    return R * c
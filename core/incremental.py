@@ -0,0 +1,148 @@
+"""
+Gün içi artımlı yeniden optimizasyon
+Planlanmış rotaya eklenen/iptal edilen duraklar en ucuz ekleme/çıkarma ile
+işlenir, ardından sadece değişen bölgede 2-opt ve Or-opt yerel araması yapılır
+"""
+import time
+
+import numpy as np
+
+from core.tour_utils import edge_distances, tour_distance, two_opt_window
+
+
+def cheapest_insertion(path, distance_matrix, city):
+    """
+    Şehri tura en az ek maliyetle ekler (yerinde)
+
+    Args:
+        path: Tur listesi (başlangıca dönüş dahil)
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        city: Eklenecek şehir indeksi
+
+    Returns:
+        int: Şehrin eklendiği konum
+    """
+    prev = np.asarray(path[:-1], dtype=np.intp)
+    nxt = np.asarray(path[1:], dtype=np.intp)
+    costs = edge_distances(distance_matrix, prev, city) + edge_distances(distance_matrix, city, nxt) \
+        - edge_distances(distance_matrix, prev, nxt)
+    position = int(np.argmin(costs)) + 1
+    path.insert(position, int(city))
+    return position
+
+
+def _or_opt_window(path, distance_matrix, lo, hi):
+    """
+    path[lo:hi+1] aralığındaki her durağı pencere içinde daha ucuz bir
+    kenara taşır (yerinde, tek geçiş)
+
+    Returns:
+        bool: Bir iyileştirme yapıldıysa True
+    """
+    improved = False
+    for i in range(max(lo, 1), min(hi, len(path) - 1)):
+        prev, city, nxt = path[i - 1], path[i], path[i + 1]
+        removal_gain = (edge_distances(distance_matrix, prev, city) + edge_distances(distance_matrix, city, nxt)
+                        - edge_distances(distance_matrix, prev, nxt))
+
+        # Durak çıkarıldıktan sonra penceredeki kenarlar (eski konum hariç)
+        rest = np.delete(path[lo:hi + 1], i - lo)
+        a, b = rest[:-1], rest[1:]
+        insertion_costs = (edge_distances(distance_matrix, a, city) + edge_distances(distance_matrix, city, b)
+                           - edge_distances(distance_matrix, a, b))
+        j = int(np.argmin(insertion_costs))
+        if removal_gain - insertion_costs[j] > 1e-9:
+            path[lo:hi + 1] = np.insert(rest, j + 1, city)
+            improved = True
+    return improved
+
+
+def local_search(path, distance_matrix, positions, window=10, time_limit=None):
+    """
+    Verilen konumların çevresinde 2-opt ve Or-opt uygular
+
+    Args:
+        path: Tur (başlangıca dönüş dahil)
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        positions: Değişen konumlar
+        window: Her konumun iki yanındaki durak sayısı
+        time_limit: Saniye cinsinden süre sınırı (None ise sınırsız)
+
+    Returns:
+        list: İyileştirilmiş tur
+    """
+    path = np.asarray(path, dtype=np.intp)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    windows = sorted({(max(0, p - window), min(len(path) - 1, p + window)) for p in positions})
+    improved = True
+    while improved and (deadline is None or time.monotonic() < deadline):
+        improved = False
+        for lo, hi in windows:
+            improved |= two_opt_window(path, distance_matrix, lo, hi)
+            improved |= _or_opt_window(path, distance_matrix, lo, hi)
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    return path.tolist()
+
+
+def reoptimize(distance_matrix, best_path, added=(), removed=(), window=None, time_limit=None):
+    """
+    Planlanmış rotayı eklenen/iptal edilen duraklara göre günceller
+
+    Tam çözüm yeniden çalıştırılmaz: iptal edilen duraklar turdan çıkarılır,
+    yeni duraklar en ucuz eklemeyle yerleştirilir, sonra yalnızca değişen
+    konumların çevresinde yerel arama yapılır. Mesafe matrisi eski ve yeni
+    tüm durakları kapsamalıdır (iptal edilenler matriste kalabilir).
+
+    Args:
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        best_path: Mevcut tur (depoda başlar ve biter)
+        added: Eklenecek durak indeksleri
+        removed: İptal edilen durak indeksleri (depo çıkarılamaz)
+        window: Yerel arama penceresi (None ise config.INCREMENTAL_WINDOW)
+        time_limit: Süre sınırı (None ise config.INCREMENTAL_TIME_LIMIT)
+
+    Returns:
+        list: Güncellenmiş tur
+        float: Toplam mesafe
+    """
+    from config import INCREMENTAL_TIME_LIMIT, INCREMENTAL_WINDOW
+
+    window = INCREMENTAL_WINDOW if window is None else window
+    time_limit = INCREMENTAL_TIME_LIMIT if time_limit is None else time_limit
+
+    path = [int(city) for city in best_path]
+    depot = path[0]
+    removed = {int(city) for city in removed}
+    if depot in removed:
+        raise ValueError("Depo rotadan çıkarılamaz")
+
+    # Çıkarma: iptal edilen durağın önceki komşusu etkilenen bölgeye eklenir
+    affected = set()
+    for idx in range(len(path) - 2, 0, -1):
+        if path[idx] in removed:
+            affected.add(path[idx - 1])
+            del path[idx]
+    affected -= removed
+
+    # En ucuz ekleme
+    for city in added:
+        city = int(city)
+        if city in path:
+            continue
+        cheapest_insertion(path, distance_matrix, city)
+        affected.add(city)
+
+    if not affected or len(path) < 5:
+        return path, tour_distance(distance_matrix, path)
+
+    inserted_distance = tour_distance(distance_matrix, path)
+    positions = [idx for idx, city in enumerate(path[:-1]) if city in affected]
+    improved_path = local_search(path, distance_matrix, positions, window, time_limit)
+    improved_distance = tour_distance(distance_matrix, improved_path)
+
+    # 2-opt simetrik mesafe varsayar; asimetrik matriste kötüleşirse ekleme sonucu korunur
+    if improved_distance > inserted_distance:
+        return path, inserted_distance
+    return improved_path, improved_distance
@@ -0,0 +1,166 @@
+"""
+Arka plan iş yürütücüsü
+Mesafe matrisi oluşturma ve ACO çözümünü süreç havuzunda çalıştırır;
+Streamlit oturumları iş kimliğiyle ilerlemeyi izler ve işi iptal edebilir
+"""
+import multiprocessing
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from core.ant_algorithm import AntColonyOptimizer
+
+
+def _run_matrix_job(job_id, coordinates, api_key, low_memory, progress, cancelled):
+    """Worker içinde mesafe matrisi oluşturur; iptal edilirse parçalar arasında durur"""
+    from core.matrix_utils import build_distance_matrix
+
+    progress[job_id] = {'stage': 'matrix'}
+    return build_distance_matrix(coordinates, api_key=api_key, low_memory=low_memory,
+                                 should_stop=lambda: cancelled.get(job_id, False))
+
+
+def _run_solve_job(job_id, distance_matrix, params, variant, start_city, checkpoint_path,
+                   progress, cancelled):
+    """Worker içinde ACO çözümünü çalıştırır, ilerlemeyi paylaşılan sözlüğe yazar"""
+    optimizer = AntColonyOptimizer(distance_matrix, verbose=False, **params)
+
+    def report(iteration, opt):
+        progress[job_id] = {
+            'stage': 'solve',
+            'method': opt.method,
+            'iteration': iteration,
+            'total': opt.n_iterations,
+            'best_distance': opt.best_distance,
+            'gap': opt.gap,
+        }
+        return not cancelled.get(job_id, False)
+
+    return optimizer.solve(start_city=start_city, variant=variant, callback=report,
+                           checkpoint_path=checkpoint_path, resume=checkpoint_path is not None)
+
+
+class JobRunner:
+    """
+    Süreç havuzu tabanlı iş yürütücüsü
+
+    Her iş bir kimlik alır; durum, ilerleme ve sonuç bu kimlikle sorgulanır.
+    Nesne süreç boyunca yaşadığı için (st.cache_resource) sayfa yeniden
+    çalıştırmalarında işler kaybolmaz. Çözüm işleri ayrı süreçlerde
+    çalıştığından eşzamanlı kullanıcılar GIL için yarışmaz.
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers: En fazla eşzamanlı iş (None ise CPU sayısı)
+        """
+        # Streamlit sunucusu çok iş parçacıklı olduğundan fork yerine spawn:
+        # fork, başka iş parçacıklarının tuttuğu kilitleri kopyalayıp worker'ı kilitleyebilir
+        context = multiprocessing.get_context('spawn')
+        self._manager = context.Manager()
+        self._progress = self._manager.dict()
+        self._cancelled = self._manager.dict()
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, fn, *args):
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._futures[job_id] = self._pool.submit(fn, job_id, *args)
+        return job_id
+
+    def submit_matrix(self, coordinates, api_key=None, low_memory=False):
+        """
+        Mesafe matrisi oluşturma işini başlatır
+
+        Args:
+            coordinates: StoreSet veya (n, 2) koordinat dizisi
+            api_key: Google Maps API anahtarı (opsiyonel)
+            low_memory: True ise float32 matris
+
+        Returns:
+            str: İş kimliği (sonuç: build_distance_matrix çıktısı)
+        """
+        return self._submit(_run_matrix_job, coordinates, api_key, low_memory,
+                            self._progress, self._cancelled)
+
+    def submit_solve(self, distance_matrix, params, variant='as', start_city=0, checkpoint_path=None):
+        """
+        ACO çözüm işini başlatır
+
+        Args:
+            distance_matrix: Mesafe matrisi
+            params: AntColonyOptimizer parametreleri
+            variant: ACO varyantı
+            start_city: Başlangıç şehri indeksi
+            checkpoint_path: Verilirse durum periyodik olarak kaydedilir ve
+                aynı dosyayla yeniden gönderilen iş kaldığı yerden sürer
+
+        Returns:
+            str: İş kimliği (sonuç: (best_path, best_distance, iteration_distances))
+        """
+        return self._submit(_run_solve_job, distance_matrix, params, variant, start_city,
+                            checkpoint_path, self._progress, self._cancelled)
+
+    def status(self, job_id):
+        """
+        İşin durumunu döndürür
+
+        Returns:
+            str: 'unknown', 'pending', 'running', 'cancelled', 'failed' veya 'done'
+        """
+        future = self._futures.get(job_id)
+        if future is None:
+            return 'unknown'
+        if future.cancelled():
+            return 'cancelled'
+        if not future.done():
+            return 'running' if future.running() else 'pending'
+        if future.exception() is not None:
+            return 'failed'
+        if self._cancelled.get(job_id, False):
+            return 'cancelled'
+        return 'done'
+
+    def progress(self, job_id):
+        """
+        İşin son ilerleme bilgisini döndürür
+
+        Returns:
+            dict: stage, method, iteration, total, best_distance, gap (henüz yoksa boş)
+        """
+        return dict(self._progress.get(job_id, {}))
+
+    def result(self, job_id):
+        """
+        Biten işin sonucunu döndürür (iptal edilen çözümde o ana kadarki en iyi sonuç)
+
+        Returns:
+            İşin sonucu; iş hata verdiyse istisna yeniden fırlatılır
+        """
+        return self._futures[job_id].result()
+
+    def cancel(self, job_id):
+        """
+        İşi iptal eder: bekleyen iş hiç başlamaz, çalışan çözüm bir sonraki
+        iterasyonda, matris oluşturma bir sonraki parçada / API çağrısında durur
+        """
+        future = self._futures.get(job_id)
+        if future is None:
+            return
+        self._cancelled[job_id] = True
+        future.cancel()
+
+    def forget(self, job_id):
+        """Biten işin kayıtlarını siler"""
+        with self._lock:
+            self._futures.pop(job_id, None)
+        self._progress.pop(job_id, None)
+        self._cancelled.pop(job_id, None)
+
+    def shutdown(self):
+        """Havuzu ve paylaşılan durumu kapatır"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._manager.shutdown()
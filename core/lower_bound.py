@@ -0,0 +1,175 @@
+"""
+Tur uzunluğu için alt sınır (Held-Karp 1-ağaç sınırı)
+Düğüm potansiyelleri alt gradyan yöntemiyle ayarlanır; en iyi tur ile sınır
+arasındaki fark, çözümün optimumdan en fazla ne kadar uzak olduğunu garanti eder
+"""
+import numpy as np
+
+from core import numba_backend
+from core.variants import nearest_neighbor_tour
+
+
+def is_symmetric(distance_matrix, chunk_size=None):
+    """
+    Matrisin simetrik olup olmadığını parça parça (ek n x n kopya olmadan) kontrol eder
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n)
+        chunk_size: Satır parçası boyutu (None ise config.LOW_MEMORY_CHUNK_SIZE)
+
+    Returns:
+        bool: d_ij == d_ji ise True
+    """
+    from config import LOW_MEMORY_CHUNK_SIZE
+
+    chunk_size = chunk_size or LOW_MEMORY_CHUNK_SIZE
+    for start in range(0, len(distance_matrix), chunk_size):
+        stop = start + chunk_size
+        if not np.array_equal(distance_matrix[start:stop], distance_matrix[:, start:stop].T):
+            return False
+    return True
+
+
+def _cost_row(distance_matrix, potentials, v, symmetric):
+    """Düğüm v'nin potansiyelli maliyet satırı: min(d_vj, d_jv) + π_v + π_j (float64)"""
+    row = distance_matrix[v].astype(np.float64)
+    if not symmetric:
+        np.minimum(row, distance_matrix[:, v], out=row)
+    row += potentials
+    row += potentials[v]
+    return row
+
+
+def one_tree(distance_matrix, potentials=None, special=0, symmetric=True):
+    """
+    Minimum 1-ağacı hesaplar
+
+    Özel düğüm dışındaki düğümlerin minimum yayılan ağacı (Prim) ile özel
+    düğümün en ucuz iki kenarı. Her tur bir 1-ağaç olduğundan toplam maliyet
+    tur uzunluğunun alt sınırıdır. Potansiyeller Prim içinde satır satır
+    eklenir; n x n maliyet matrisi oluşturulmaz.
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n, n >= 3; dtype korunur)
+        potentials: Düğüm potansiyelleri π (None ise sıfır)
+        special: Özel düğüm indeksi
+        symmetric: False ise min(d_ij, d_ji) kullanılır
+
+    Returns:
+        float: 1-ağaç maliyeti
+        numpy.ndarray: Düğüm dereceleri
+    """
+    n = len(distance_matrix)
+    potentials = np.zeros(n) if potentials is None else np.asarray(potentials, dtype=np.float64)
+    if numba_backend.NUMBA_AVAILABLE and isinstance(distance_matrix, np.ndarray):
+        total, degrees = numba_backend.one_tree(distance_matrix, potentials, special, symmetric)
+        return float(total), degrees
+
+    degrees = np.zeros(n, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[special] = True
+
+    root = 1 if special == 0 else 0
+    in_tree[root] = True
+    key = _cost_row(distance_matrix, potentials, root, symmetric)
+    parent = np.full(n, root)
+    key[in_tree] = np.inf
+    total = 0.0
+
+    for _ in range(n - 2):
+        v = int(np.argmin(key))
+        total += key[v]
+        degrees[v] += 1
+        degrees[parent[v]] += 1
+        in_tree[v] = True
+        key[v] = np.inf
+
+        # Ağaca eklenen düğüm üzerinden daha ucuz bağlanan düğümler
+        costs = _cost_row(distance_matrix, potentials, v, symmetric)
+        closer = (costs < key) & ~in_tree
+        key[closer] = costs[closer]
+        parent[closer] = v
+
+    row = _cost_row(distance_matrix, potentials, special, symmetric)
+    row[special] = np.inf
+    cheapest = np.argpartition(row, 1)[:2]
+    total += row[cheapest].sum()
+    degrees[cheapest] += 1
+    degrees[special] += 2
+    return float(total), degrees
+
+
+def held_karp_bound(distance_matrix, upper_bound=None, max_iterations=None, special=0):
+    """
+    Held-Karp (1-ağaç + alt gradyan) alt sınırını hesaplar
+
+    Düğüm potansiyelleri π ile kenar maliyetleri c_ij + π_i + π_j olur;
+    her π için L(π) = 1-ağaç(π) - 2·Σπ geçerli bir alt sınırdır. Potansiyeller
+    derecesi 2'den büyük düğümlerde artırılıp küçüklerde azaltılır.
+    Asimetrik matrislerde min(d_ij, d_ji) kullanılır (yine geçerli sınır).
+    Matris kopyalanmaz; ek bellek O(n), iterasyon başına süre O(n^2).
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n, float32 memmap olabilir)
+        upper_bound: Bilinen bir tur uzunluğu (adım boyu için; None ise
+            en yakın komşu turu)
+        max_iterations: Alt gradyan iterasyonu (None ise config.LOWER_BOUND_ITERATIONS)
+        special: 1-ağacın özel düğümü
+
+    Returns:
+        float: Alt sınır
+    """
+    from config import LOWER_BOUND_ITERATIONS
+
+    n = len(distance_matrix)
+    if n < 3:
+        return float(distance_matrix[0, 1]) + float(distance_matrix[1, 0]) if n == 2 else 0.0
+
+    max_iterations = LOWER_BOUND_ITERATIONS if max_iterations is None else max_iterations
+    if upper_bound is None:
+        _, upper_bound = nearest_neighbor_tour(distance_matrix)
+
+    symmetric = is_symmetric(distance_matrix)
+    potentials = np.zeros(n)
+    best_bound = -np.inf
+    step_scale = 2.0
+    stalled = 0
+
+    for _ in range(max_iterations):
+        tree_cost, degrees = one_tree(distance_matrix, potentials, special, symmetric)
+        bound = tree_cost - 2.0 * potentials.sum()
+
+        if bound > best_bound + 1e-9:
+            best_bound = bound
+            stalled = 0
+        else:
+            # İyileşme durursa adım boyu yarıya iner
+            stalled += 1
+            if stalled >= 10:
+                step_scale /= 2.0
+                stalled = 0
+
+        subgradient = degrees - 2
+        norm = float((subgradient * subgradient).sum())
+        # Tüm dereceler 2 ise 1-ağaç bir turdur: sınır optimumdur
+        if norm == 0 or step_scale < 1e-6 or upper_bound - best_bound <= 1e-9 * upper_bound:
+            break
+        potentials += step_scale * (upper_bound - bound) / norm * subgradient
+
+    return float(best_bound)
+
+
+def optimality_gap(distance, lower_bound):
+    """
+    Tur uzunluğunun alt sınıra göre garanti edilen açığı
+
+    Args:
+        distance: Tur uzunluğu
+        lower_bound: Alt sınır
+
+    Returns:
+        float: (distance - lower_bound) / lower_bound (0.02 = en fazla %2 optimumdan uzak)
+    """
+    if not lower_bound > 0:
+        return float('inf')
+    return max(0.0, (distance - lower_bound) / lower_bound)
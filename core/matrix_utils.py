@@ -5,10 +5,11 @@ Google Maps API kullanarak driving distance hesaplama
 import googlemaps
 import numpy as np
 import pandas as pd
-from config import GOOGLE_MAPS_API_KEY
+from config import GOOGLE_MAPS_API_KEY, LOW_MEMORY_CHUNK_SIZE
 import os
 from dotenv import load_dotenv
 import streamlit as st
+from data.store_set import as_coordinate_array
 
 # .env dosyasını yükle
 load_dotenv()
@@ -43,24 +44,30 @@ def initialize_google_maps_client():
         )
     return googlemaps.Client(key=api_key)
 
-def calculate_distance_matrix_google_maps(coordinates, client=None):
+def calculate_distance_matrix_google_maps(coordinates, client=None, dtype=np.float64,
+                                          with_duration=True, should_stop=None):
     """
     Google Maps API kullanarak mesafe matrisi oluşturur
     
     Args:
-        coordinates: [(lat, lon), ...] formatında koordinat listesi
+        coordinates: StoreSet, (n, 2) dizi veya [(lat, lon), ...] listesi
         client: Google Maps API istemcisi (None ise yeni oluşturulur)
+        dtype: Matris veri tipi (düşük bellek için np.float32)
+        with_duration: False ise süre matrisi ayrılmaz
+        should_stop: Her API çağrısından önce çağrılır; True dönerse
+            hesaplama durdurulur ve (None, None) döner
     
     Returns:
         numpy.ndarray: Mesafe matrisi (km cinsinden)
-        numpy.ndarray: Süre matrisi (saniye cinsinden)
+        numpy.ndarray: Süre matrisi (saniye cinsinden, with_duration=False ise None)
     """
     if client is None:
         client = initialize_google_maps_client()
     
+    coordinates = as_coordinate_array(coordinates)
     n = len(coordinates)
-    distance_matrix = np.zeros((n, n))
-    duration_matrix = np.zeros((n, n))
+    distance_matrix = np.zeros((n, n), dtype=dtype)
+    duration_matrix = np.zeros((n, n), dtype=dtype) if with_duration else None
     
     # Koordinatları string formatına çevir
     origins = [f"{lat},{lon}" for lat, lon in coordinates]
@@ -76,6 +83,9 @@ def calculate_distance_matrix_google_maps(coordinates, client=None):
         for j in range(0, n, batch_size):
             batch_destinations = destinations[j:min(j+batch_size, n)]
             
+            if should_stop is not None and should_stop():
+                return None, None
+            
             try:
                 # Distance Matrix API çağrısı
                 result = client.distance_matrix(
@@ -91,7 +101,8 @@ def calculate_distance_matrix_google_maps(coordinates, client=None):
                     for idx_j, element in enumerate(row['elements']):
                         if element['status'] == 'OK':
                             distance_matrix[i + idx_i, j + idx_j] = element['distance']['value'] / 1000.0  # km
-                            duration_matrix[i + idx_i, j + idx_j] = element['duration']['value']  # saniye
+                            if with_duration:
+                                duration_matrix[i + idx_i, j + idx_j] = element['duration']['value']  # saniye
                         else:
                             # Hata durumunda Haversine mesafesi kullan
                             from core.haversine import haversine_distance
@@ -100,7 +111,8 @@ def calculate_distance_matrix_google_maps(coordinates, client=None):
                                 coordinates[j + idx_j]
                             )
                             distance_matrix[i + idx_i, j + idx_j] = dist
-                            duration_matrix[i + idx_i, j + idx_j] = dist * 60  # Yaklaşık süre (km başına 1 dakika)
+                            if with_duration:
+                                duration_matrix[i + idx_i, j + idx_j] = dist * 60  # Yaklaşık süre (km başına 1 dakika)
             
             except Exception as e:
                 print(f"API hatası (i={i}, j={j}): {e}")
@@ -113,38 +125,103 @@ def calculate_distance_matrix_google_maps(coordinates, client=None):
                             coordinates[j + idx_j]
                         )
                         distance_matrix[i + idx_i, j + idx_j] = dist
-                        duration_matrix[i + idx_i, j + idx_j] = dist * 60
+                        if with_duration:
+                            duration_matrix[i + idx_i, j + idx_j] = dist * 60
     
     return distance_matrix, duration_matrix
 
-def calculate_distance_matrix_haversine(coordinates):
+def calculate_distance_matrix_haversine(coordinates, dtype=np.float64, out=None, low_memory=False,
+                                        should_stop=None):
     """
     Haversine formülü kullanarak mesafe matrisi oluşturur (fallback)
     
     Args:
-        coordinates: [(lat, lon), ...] formatında koordinat listesi
+        coordinates: StoreSet, (n, 2) dizi veya [(lat, lon), ...] listesi
+        dtype: Matris veri tipi
+        out: Sonucun yazılacağı dizi (ör. create_distance_matrix_file çıktısı)
+        low_memory: True ise float32 kullanılır ve matris parça parça doldurulur
+        should_stop: Satır parçaları arasında çağrılır; True dönerse None döner
     
     Returns:
-        numpy.ndarray: Mesafe matrisi (km cinsinden)
+        numpy.ndarray: Mesafe matrisi (km cinsinden, durdurulduysa None)
     """
-    from core.haversine import haversine_distance
-    
-    n = len(coordinates)
-    distance_matrix = np.zeros((n, n))
+    from core.haversine import haversine_matrix
     
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                distance_matrix[i, j] = haversine_distance(coordinates[i], coordinates[j])
+    coordinates = as_coordinate_array(coordinates)
+    # İptal edilebilmesi için durdurma kontrolü verildiğinde de parça parça doldurulur
+    chunk_size = LOW_MEMORY_CHUNK_SIZE if low_memory or should_stop is not None else None
+    distance_matrix = haversine_matrix(coordinates, dtype=np.float32 if low_memory else dtype,
+                                       out=out, chunk_size=chunk_size, should_stop=should_stop)
+    if distance_matrix is None:
+        return None
+    np.fill_diagonal(distance_matrix, 0.0)
     
     return distance_matrix
 
+def build_distance_matrix(coordinates, api_key=None, low_memory=False, should_stop=None):
+    """
+    API anahtarı varsa Google Maps, yoksa veya hata olursa Haversine ile matris oluşturur
+    
+    Args:
+        coordinates: StoreSet, (n, 2) dizi veya [(lat, lon), ...] listesi
+        api_key: Google Maps API anahtarı (opsiyonel)
+        low_memory: True ise float32 matris oluşturulur
+        should_stop: API çağrıları / satır parçaları arasında çağrılır;
+            True dönerse hesaplama durdurulur ve None döner
+    
+    Returns:
+        numpy.ndarray: Mesafe matrisi (km cinsinden)
+        str: Kullanılan yöntem ('google' veya 'haversine')
+        str: Google Maps hatası (yoksa None)
+        (durdurulduysa bu üçlü yerine None)
+    """
+    api_error = None
+    if api_key:
+        os.environ['GOOGLE_MAPS_API_KEY'] = api_key
+        try:
+            client = initialize_google_maps_client()
+            distance_matrix, _ = calculate_distance_matrix_google_maps(
+                coordinates, client,
+                dtype=np.float32 if low_memory else np.float64,
+                with_duration=False, should_stop=should_stop
+            )
+            return (distance_matrix, 'google', None) if distance_matrix is not None else None
+        except Exception as e:
+            api_error = str(e)
+    
+    distance_matrix = calculate_distance_matrix_haversine(coordinates, low_memory=low_memory,
+                                                          should_stop=should_stop)
+    return (distance_matrix, 'haversine', api_error) if distance_matrix is not None else None
+
 def save_distance_matrix(distance_matrix, filename='distance_matrix.npy'):
     """Mesafe matrisini kaydet"""
     np.save(filename, distance_matrix)
 
-def load_distance_matrix(filename='distance_matrix.npy'):
-    """Mesafe matrisini yükle"""
-    return np.load(filename)
+def load_distance_matrix(filename='distance_matrix.npy', mmap_mode=None):
+    """
+    Mesafe matrisini yükle
+    
+    Args:
+        filename: .npy dosya yolu
+        mmap_mode: 'r' verilirse matris belleğe okunmaz, diskten eşlenir
+    """
+    return np.load(filename, mmap_mode=mmap_mode)
+
+def create_distance_matrix_file(n, filename='distance_matrix.npy', dtype=np.float32):
+    """
+    Diskte (n, n) boyutunda bellek eşlemeli bir mesafe matrisi oluşturur
+    
+    calculate_distance_matrix_haversine(..., out=...) ile doldurulup
+    AntColonyOptimizer(..., low_memory=True) ile kopyasız kullanılabilir.
+    
+    Args:
+        n: Nokta sayısı
+        filename: .npy dosya yolu
+        dtype: Matris veri tipi
+    
+    Returns:
+        numpy.memmap: Yazılabilir matris
+    """
+    return np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=(n, n))
 
 
@@ -0,0 +1,358 @@
+"""
+Numba ile derlenmiş ACO çekirdekleri (opsiyonel)
+Numba yüklüyse tur oluşturma, tur değerlendirme, feromon güncelleme,
+Held-Karp tabloları ve 1-ağaç alt sınırı burada derlenmiş döngülerle
+yapılır; aynı tohumla NumPy yoluyla aynı sonucu verir.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _power(x, exponent):
+        # NumPy'nin dizi ** skaler hızlı yollarıyla aynı sonucu üretmek için
+        if exponent == 1.0:
+            return x
+        if exponent == 2.0:
+            return x * x
+        if exponent == 0.5:
+            return np.sqrt(x)
+        if exponent == 0.0:
+            return 1.0
+        if exponent == -1.0:
+            return 1.0 / x
+        return x ** exponent
+
+    @njit(cache=True)
+    def construct_tours(distance_matrix, pheromone, alpha, beta, start_city, n_ants, uniforms):
+        """
+        Rulet seçimiyle tüm karıncaların turlarını oluşturur
+
+        Args:
+            distance_matrix: Mesafe matrisi (n x n)
+            pheromone: Yoğun feromon matrisi (n x n)
+            alpha: Feromon önem katsayısı
+            beta: Mesafe önem katsayısı
+            start_city: Başlangıç şehri indeksi
+            n_ants: Karınca sayısı
+            uniforms: n_ants * (n - 1) adet [0, 1) sayı (karınca karınca, adım adım)
+
+        Returns:
+            numpy.ndarray: (n_ants, n + 1) turlar
+        """
+        n = distance_matrix.shape[0]
+        paths = np.empty((n_ants, n + 1), dtype=np.int64)
+        unvisited = np.empty(n, dtype=np.int64)
+        cumulative = np.empty(n, dtype=np.float64)
+        u_index = 0
+
+        for ant in range(n_ants):
+            m = 0
+            for city in range(n):
+                if city != start_city:
+                    unvisited[m] = city
+                    m += 1
+
+            current = start_city
+            paths[ant, 0] = start_city
+
+            for step in range(1, n):
+                # Kümülatif ağırlıklar (ziyaret edilmemiş şehir sırasıyla)
+                total = 0.0
+                for j in range(m):
+                    city = unvisited[j]
+                    pheromone_value = _power(np.float64(pheromone[current, city]), alpha)
+                    distance_value = _power(1.0 / (np.float64(distance_matrix[current, city]) + 1e-10), beta)
+                    total += pheromone_value * distance_value
+                    cumulative[j] = total
+
+                u = uniforms[u_index]
+                u_index += 1
+
+                if not total > 0:
+                    index = int(u * m)
+                else:
+                    target = u * total
+                    index = m - 1
+                    for j in range(m):
+                        if cumulative[j] > target:
+                            index = j
+                            break
+
+                # Sırayı koruyarak listeden çıkar
+                current = unvisited[index]
+                for j in range(index, m - 1):
+                    unvisited[j] = unvisited[j + 1]
+                m -= 1
+
+                paths[ant, step] = current
+
+            paths[ant, n] = start_city
+
+        return paths
+
+    @njit(cache=True)
+    def construct_tours_acs(distance_matrix, pheromone, alpha, beta, start_city, n_ants,
+                            exploit, uniforms, xi, tau0):
+        """
+        Ant Colony System turlarını karıncalar aynı adımda ilerleyerek oluşturur
+
+        Her adımda tüm karıncalar seçimini yapar (sömürüde argmax, aksi halde
+        rulet), ardından o adımda geçilen kenarlara yerel güncelleme toplu
+        uygulanır: τ = (1 - ξ)·τ + ξ·τ0 (tekrarlanan kenar bir kez).
+        Feromon yerinde güncellenir.
+
+        Args:
+            distance_matrix: Mesafe matrisi (n x n)
+            pheromone: Yoğun feromon matrisi (n x n)
+            alpha: Feromon önem katsayısı
+            beta: Mesafe önem katsayısı
+            start_city: Başlangıç şehri indeksi
+            n_ants: Karınca sayısı
+            exploit: (n - 1, n_ants) sömürü (argmax) kararları
+            uniforms: (n - 1, n_ants) rulet için [0, 1) sayılar
+            xi: Yerel güncelleme oranı
+            tau0: Başlangıç feromonu
+
+        Returns:
+            numpy.ndarray: (n_ants, n + 1) turlar
+        """
+        n = distance_matrix.shape[0]
+        paths = np.empty((n_ants, n + 1), dtype=np.int64)
+        visited = np.zeros((n_ants, n), dtype=np.bool_)
+        current = np.full(n_ants, start_city, dtype=np.int64)
+        chosen = np.empty(n_ants, dtype=np.int64)
+        blended = np.empty(n_ants, dtype=np.float64)
+        weights = np.empty(n, dtype=np.float64)
+        for ant in range(n_ants):
+            paths[ant, 0] = start_city
+            paths[ant, n] = start_city
+            visited[ant, start_city] = True
+
+        for step in range(1, n):
+            remaining = n - step
+            for ant in range(n_ants):
+                c = current[ant]
+                total = 0.0
+                best = -1.0
+                best_j = -1
+                last_j = -1
+                for j in range(n):
+                    if visited[ant, j]:
+                        weights[j] = 0.0
+                        continue
+                    value = (_power(np.float64(pheromone[c, j]), alpha)
+                             * _power(1.0 / (np.float64(distance_matrix[c, j]) + 1e-10), beta))
+                    weights[j] = value
+                    total += value
+                    if value > best:
+                        best = value
+                        best_j = j
+                    last_j = j
+
+                if exploit[step - 1, ant]:
+                    chosen[ant] = best_j
+                    continue
+
+                u = uniforms[step - 1, ant]
+                if not total > 0:
+                    # Sönmüş satır: ziyaret edilmemişler arasında düzgün seçim
+                    k = int(u * remaining)
+                    for j in range(n):
+                        if not visited[ant, j]:
+                            if k == 0:
+                                chosen[ant] = j
+                                break
+                            k -= 1
+                    continue
+
+                target = u * total
+                cumulative = 0.0
+                chosen[ant] = last_j
+                for j in range(n):
+                    cumulative += weights[j]
+                    if cumulative > target:
+                        chosen[ant] = j
+                        break
+
+            # Yerel güncelleme: önce tüm yeni değerler eski feromondan hesaplanır
+            for ant in range(n_ants):
+                blended[ant] = (1 - xi) * np.float64(pheromone[current[ant], chosen[ant]]) + xi * tau0
+            for ant in range(n_ants):
+                pheromone[current[ant], chosen[ant]] = blended[ant]
+                visited[ant, chosen[ant]] = True
+                paths[ant, step] = chosen[ant]
+                current[ant] = chosen[ant]
+
+        return paths
+
+    @njit(cache=True)
+    def evaluate_tours(distance_matrix, paths):
+        """
+        Turların toplam mesafelerini sıralı toplama ile hesaplar
+
+        Args:
+            distance_matrix: Mesafe matrisi (n x n)
+            paths: (m, n + 1) turlar
+
+        Returns:
+            numpy.ndarray: (m,) toplam mesafeler
+        """
+        distances = np.empty(paths.shape[0], dtype=np.float64)
+        for ant in range(paths.shape[0]):
+            total = 0.0
+            for i in range(paths.shape[1] - 1):
+                total += np.float64(distance_matrix[paths[ant, i], paths[ant, i + 1]])
+            distances[ant] = total
+        return distances
+
+    @njit(cache=True)
+    def update_pheromone_dense(pheromone, factor, paths, deposits):
+        """
+        Yoğun feromon matrisinde buharlaşma ve bırakma uygular (yerinde)
+
+        Args:
+            pheromone: Yoğun feromon matrisi (n x n)
+            factor: Buharlaşma çarpanı (1 - oran), matris veri tipinde
+            paths: (m, n + 1) turlar
+            deposits: (m,) tur başına bırakılacak feromon (0: bırakma yok)
+        """
+        n = pheromone.shape[0]
+        for i in range(n):
+            for j in range(n):
+                pheromone[i, j] *= factor
+
+        for ant in range(paths.shape[0]):
+            amount = deposits[ant]
+            if amount > 0:
+                for i in range(paths.shape[1] - 1):
+                    pheromone[paths[ant, i], paths[ant, i + 1]] += amount
+
+    @njit(cache=True)
+    def held_karp_tables(between, first):
+        """
+        Held-Karp maliyet ve önceki şehir tablolarını doldurur
+
+        Maskeler sayısal sırayla işlenir (S - {j} her zaman S'den küçüktür);
+        S - {j} dışındaki k için maliyet sonsuz olduğundan iç döngü dalsızdır.
+        Eşitlikte NumPy yolu gibi en küçük indeksli önceki şehir seçilir.
+
+        Args:
+            between: Depo dışındaki şehirler arası mesafeler (m x m)
+            first: Depodan her şehre mesafe (m,)
+
+        Returns:
+            numpy.ndarray: (2^m, m) maliyet tablosu
+            numpy.ndarray: (2^m, m) önceki şehir tablosu (int8)
+        """
+        m = between.shape[0]
+        n_masks = 1 << m
+        between_t = between.T.copy()
+        cost = np.full((n_masks, m), np.inf)
+        parent = np.full((n_masks, m), -1, dtype=np.int8)
+        for j in range(m):
+            cost[1 << j, j] = first[j]
+
+        for mask in range(1, n_masks):
+            for j in range(m):
+                bit = 1 << j
+                if mask & bit == 0 or mask == bit:
+                    continue
+                row = cost[mask ^ bit]
+                column = between_t[j]
+                best = np.inf
+                best_k = -1
+                for k in range(m):
+                    value = row[k] + column[k]
+                    if value < best:
+                        best = value
+                        best_k = k
+                cost[mask, j] = best
+                parent[mask, j] = best_k
+        return cost, parent
+
+    @njit(cache=True)
+    def one_tree(distance_matrix, potentials, special, symmetric):
+        """
+        Potansiyelli minimum 1-ağacı Prim ile hesaplar
+
+        Kenar maliyeti min(d_ij, d_ji) + π_i + π_j döngü içinde hesaplanır
+        (n x n maliyet matrisi oluşturulmaz).
+
+        Args:
+            distance_matrix: Mesafe matrisi (n x n)
+            potentials: (n,) düğüm potansiyelleri
+            special: Özel düğüm indeksi
+            symmetric: False ise min(d_ij, d_ji) kullanılır
+
+        Returns:
+            float: 1-ağaç maliyeti
+            numpy.ndarray: (n,) düğüm dereceleri
+        """
+        n = distance_matrix.shape[0]
+        degrees = np.zeros(n, dtype=np.int64)
+        in_tree = np.zeros(n, dtype=np.bool_)
+        key = np.empty(n)
+        parent = np.empty(n, dtype=np.int64)
+        in_tree[special] = True
+
+        v = 1 if special == 0 else 0
+        in_tree[v] = True
+        for j in range(n):
+            key[j] = np.inf
+            parent[j] = v
+        total = 0.0
+
+        for _ in range(n - 2):
+            # Ağaca son eklenen v üzerinden daha ucuz bağlanan düğümler; en ucuzu seçilir
+            best = np.inf
+            best_j = -1
+            for j in range(n):
+                if in_tree[j]:
+                    continue
+                cost = np.float64(distance_matrix[v, j])
+                if not symmetric:
+                    cost = min(cost, np.float64(distance_matrix[j, v]))
+                cost += potentials[v] + potentials[j]
+                if cost < key[j]:
+                    key[j] = cost
+                    parent[j] = v
+                if key[j] < best:
+                    best = key[j]
+                    best_j = j
+            v = best_j
+            total += best
+            degrees[v] += 1
+            degrees[parent[v]] += 1
+            in_tree[v] = True
+
+        # Özel düğümün en ucuz iki kenarı
+        first = np.inf
+        second = np.inf
+        first_j = -1
+        second_j = -1
+        for j in range(n):
+            if j == special:
+                continue
+            cost = np.float64(distance_matrix[special, j])
+            if not symmetric:
+                cost = min(cost, np.float64(distance_matrix[j, special]))
+            cost += potentials[special] + potentials[j]
+            if cost < first:
+                second, second_j = first, first_j
+                first, first_j = cost, j
+            elif cost < second:
+                second, second_j = cost, j
+        total += first + second
+        degrees[first_j] += 1
+        degrees[second_j] += 1
+        degrees[special] += 2
+        return total, degrees
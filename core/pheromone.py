@@ -0,0 +1,230 @@
+"""
+Feromon saklama yapıları
+Yoğun (n x n) matris veya aday grafiğine sınırlı seyrek saklama
+"""
+import numpy as np
+
+
+class DensePheromone:
+    """
+    Yoğun n x n feromon matrisi
+    """
+    
+    def __init__(self, n_cities, initial=0.1, dtype=np.float64):
+        """
+        Args:
+            n_cities: Şehir sayısı
+            initial: Başlangıç feromon değeri
+            dtype: Matris veri tipi
+        """
+        self.values = np.full((n_cities, n_cities), initial, dtype=dtype)
+    
+    def row(self, city, targets):
+        """
+        Bir şehirden hedef şehirlere giden kenarların feromon değerleri
+        
+        Args:
+            city: Kaynak şehir indeksi
+            targets: Hedef şehir indeksleri
+        
+        Returns:
+            numpy.ndarray: Feromon değerleri
+        """
+        return self.values[city, targets]
+    
+    def rows(self, cities):
+        """
+        Birden fazla şehrin tam feromon satırları
+        
+        Args:
+            cities: Kaynak şehir indeksleri
+        
+        Returns:
+            numpy.ndarray: (len(cities), n) feromon değerleri
+        """
+        return self.values[cities]
+    
+    def evaporate(self, rate):
+        """Tüm kenarlarda buharlaşma uygular"""
+        self.values *= self.values.dtype.type(1 - rate)
+    
+    def deposit(self, path, amount):
+        """
+        Yol üzerindeki kenarlara feromon bırakır
+        
+        Args:
+            path: Şehir ziyaret sırası
+            amount: Kenar başına bırakılacak feromon
+        """
+        path = np.asarray(path, dtype=np.intp)
+        # Miktar matris tipine çevrilir (float32'de toplama da float32 yapılır)
+        np.add.at(self.values, (path[:-1], path[1:]), self.values.dtype.type(amount))
+    
+    def blend(self, path, weight, target):
+        """
+        Yol kenarlarını hedef değere doğru çeker: τ = (1 - w)·τ + w·hedef
+        
+        Args:
+            path: Şehir ziyaret sırası
+            weight: Karışım oranı w
+            target: Hedef feromon değeri
+        """
+        path = np.asarray(path, dtype=np.intp)
+        self.blend_edges(path[:-1], path[1:], weight, target)
+    
+    def blend_edges(self, sources, targets, weight, target):
+        """
+        Verilen kenarları hedef değere doğru çeker (tekrarlanan kenar bir kez)
+        
+        Hesap float64 yapılıp matris tipine yazılır (Numba çekirdeğiyle aynı sonuç).
+        
+        Args:
+            sources: Kaynak şehir indeksleri
+            targets: Hedef şehir indeksleri
+            weight: Karışım oranı w
+            target: Hedef feromon değeri
+        """
+        edges = (np.asarray(sources, dtype=np.intp), np.asarray(targets, dtype=np.intp))
+        self.values[edges] = (1 - weight) * self.values[edges].astype(np.float64) + weight * target
+    
+    def clip(self, lower, upper):
+        """Feromonu [lower, upper] aralığına sınırlar"""
+        np.clip(self.values, lower, upper, out=self.values)
+    
+    def fill(self, value):
+        """Tüm kenarlara aynı feromon değerini atar"""
+        self.values.fill(value)
+    
+    def to_dense(self):
+        """Yoğun feromon matrisi"""
+        return self.values
+    
+    def get_state(self):
+        """Kontrol noktası için durum dizileri"""
+        return {'values': self.values}
+    
+    def set_state(self, state):
+        """get_state çıktısını geri yükler (dizi yerinde güncellenir)"""
+        self.values[...] = state['values']
+
+
+class SparsePheromone:
+    """
+    Aday grafiğine sınırlı seyrek feromon
+    
+    Her şehir için sadece aday komşulara giden kenarların değeri saklanır
+    (candidates ile hizalı (n, k) dizi). Aday olmayan kenarlar ortak bir
+    varsayılan değeri paylaşır; buharlaşma ve bırakma O(n·k) maliyetlidir.
+    Aday olmayan kenarlara bırakılan feromon yok sayılır.
+    """
+    
+    def __init__(self, candidates, initial=0.1, dtype=np.float64):
+        """
+        Args:
+            candidates: (n, k) aday komşu indeksleri (satırlar sıralı olmalı)
+            initial: Başlangıç feromon değeri
+            dtype: Dizi veri tipi
+        """
+        self.candidates = np.asarray(candidates, dtype=np.intp)
+        self.values = np.full(self.candidates.shape, initial, dtype=dtype)
+        self.default = dtype(initial)
+    
+    def _positions(self, city, targets):
+        """Hedeflerin aday satırındaki konumları ve eşleşme maskesi"""
+        row_candidates = self.candidates[city]
+        positions = np.searchsorted(row_candidates, targets)
+        positions = np.minimum(positions, len(row_candidates) - 1)
+        return positions, row_candidates[positions] == targets
+    
+    def row(self, city, targets):
+        """
+        Bir şehirden hedef şehirlere giden kenarların feromon değerleri
+        
+        Args:
+            city: Kaynak şehir indeksi
+            targets: Hedef şehir indeksleri
+        
+        Returns:
+            numpy.ndarray: Feromon değerleri
+        """
+        targets = np.asarray(targets, dtype=np.intp)
+        result = np.full(len(targets), self.default, dtype=self.values.dtype)
+        positions, found = self._positions(city, targets)
+        result[found] = self.values[city, positions[found]]
+        return result
+    
+    def rows(self, cities):
+        """
+        Birden fazla şehrin tam feromon satırları
+        
+        Args:
+            cities: Kaynak şehir indeksleri
+        
+        Returns:
+            numpy.ndarray: (len(cities), n) feromon değerleri
+        """
+        cities = np.asarray(cities, dtype=np.intp)
+        result = np.full((len(cities), len(self.candidates)), self.default, dtype=self.values.dtype)
+        result[np.arange(len(cities))[:, np.newaxis], self.candidates[cities]] = self.values[cities]
+        return result
+    
+    def evaporate(self, rate):
+        """Aday kenarlarda ve varsayılan değerde buharlaşma uygular"""
+        self.values *= self.values.dtype.type(1 - rate)
+        self.default = self.values.dtype.type(self.default * (1 - rate))
+    
+    def deposit(self, path, amount):
+        """
+        Yol üzerindeki aday kenarlara feromon bırakır
+        
+        Args:
+            path: Şehir ziyaret sırası
+            amount: Kenar başına bırakılacak feromon
+        """
+        path = np.asarray(path, dtype=np.intp)
+        sources, targets = path[:-1], path[1:]
+        matches = self.candidates[sources] == targets[:, np.newaxis]
+        edge_idx, slot = np.nonzero(matches)
+        np.add.at(self.values, (sources[edge_idx], slot), self.values.dtype.type(amount))
+    
+    def blend(self, path, weight, target):
+        """
+        Yol üzerindeki aday kenarları hedef değere çeker: τ = (1 - w)·τ + w·hedef
+        
+        Args:
+            path: Şehir ziyaret sırası
+            weight: Karışım oranı w
+            target: Hedef feromon değeri
+        """
+        path = np.asarray(path, dtype=np.intp)
+        sources, targets = path[:-1], path[1:]
+        edge_idx, slot = np.nonzero(self.candidates[sources] == targets[:, np.newaxis])
+        edges = (sources[edge_idx], slot)
+        self.values[edges] = (1 - weight) * self.values[edges] + weight * target
+    
+    def clip(self, lower, upper):
+        """Feromonu [lower, upper] aralığına sınırlar"""
+        np.clip(self.values, lower, upper, out=self.values)
+        self.default = self.values.dtype.type(min(max(self.default, lower), upper))
+    
+    def fill(self, value):
+        """Tüm kenarlara aynı feromon değerini atar"""
+        self.values.fill(value)
+        self.default = self.values.dtype.type(value)
+    
+    def to_dense(self):
+        """Yoğun feromon matrisi (sadece küçük örnekler ve inceleme için)"""
+        n = len(self.candidates)
+        dense = np.full((n, n), self.default, dtype=self.values.dtype)
+        rows = np.repeat(np.arange(n), self.candidates.shape[1])
+        dense[rows, self.candidates.ravel()] = self.values.ravel()
+        return dense
+    
+    def get_state(self):
+        """Kontrol noktası için durum dizileri"""
+        return {'values': self.values, 'default': np.asarray(self.default)}
+    
+    def set_state(self, state):
+        """get_state çıktısını geri yükler (dizi yerinde güncellenir)"""
+        self.values[...] = state['values']
+        self.default = self.values.dtype.type(state['default'])
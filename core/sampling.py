@@ -0,0 +1,190 @@
+"""
+Bir sonraki şehir seçimi için örnekleme yöntemleri
+Her optimizer kendi np.random.Generator nesnesini kullanır (tekrarlanabilir çalışmalar)
+"""
+import numpy as np
+
+
+class RouletteSampler:
+    """
+    Kümülatif toplam ile rulet tekerleği seçimi
+    
+    Düzgün dağılımlı sayılar önceden bloklar halinde üretilir; her seçim
+    bir cumsum ve bir searchsorted çağrısıdır (np.random.choice'un
+    doğrulama ve normalizasyon maliyeti olmadan).
+    """
+    
+    batched = False
+    
+    def __init__(self, rng, buffer_size=4096):
+        """
+        Args:
+            rng: np.random.Generator
+            buffer_size: Önceden üretilecek düzgün sayı adedi
+        """
+        self.rng = rng
+        self.buffer_size = buffer_size
+        self._buffer = np.empty(0)
+        self._position = 0
+    
+    def _next_uniform(self):
+        """Önceden üretilmiş akıştan bir sonraki [0, 1) sayıyı döndürür"""
+        if self._position >= len(self._buffer):
+            self._buffer = self.rng.random(self.buffer_size)
+            self._position = 0
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+    
+    def take(self, count):
+        """
+        Akıştan sıradaki count adet sayıyı döndürür
+        
+        select() ile aynı akışı tüketir; derlenmiş çekirdeklere toplu
+        olarak verilip aynı tohumla aynı seçimlerin yapılmasını sağlar.
+        
+        Args:
+            count: Sayı adedi
+        
+        Returns:
+            numpy.ndarray: [0, 1) sayılar
+        """
+        out = np.empty(count)
+        filled = 0
+        while filled < count:
+            if self._position >= len(self._buffer):
+                self._buffer = self.rng.random(self.buffer_size)
+                self._position = 0
+            chunk = min(count - filled, len(self._buffer) - self._position)
+            out[filled:filled + chunk] = self._buffer[self._position:self._position + chunk]
+            self._position += chunk
+            filled += chunk
+        return out
+    
+    def select(self, weights):
+        """
+        Ağırlıklarla orantılı olarak bir indeks seçer
+        
+        Args:
+            weights: Normalize edilmemiş, negatif olmayan ağırlıklar
+        
+        Returns:
+            int: Seçilen indeks
+        """
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        u = self._next_uniform()
+        if not total > 0:
+            return int(u * len(weights))
+        index = int(np.searchsorted(cumulative, u * total, side='right'))
+        return min(index, len(weights) - 1)
+    
+    def select_batch(self, weights):
+        """
+        Her satır için ağırlıklarla orantılı bir indeks seçer
+        
+        Args:
+            weights: (m, n) normalize edilmemiş ağırlıklar
+        
+        Returns:
+            numpy.ndarray: (m,) seçilen indeksler
+        """
+        return np.array([self.select(row) for row in weights], dtype=np.intp)
+    
+    def get_state(self):
+        """Kontrol noktası için durum dizileri (önceden üretilmiş sayılar dahil)"""
+        return {'buffer': self._buffer, 'position': np.asarray(self._position)}
+    
+    def set_state(self, state):
+        """get_state çıktısını geri yükler"""
+        self._buffer = np.array(state['buffer'])
+        self._position = int(state['position'])
+
+
+class GumbelSampler:
+    """
+    Log-ağırlıklar üzerinde Gumbel-max seçimi
+    
+    argmax(log w + G), G ~ Gumbel(0, 1), ağırlıklarla orantılı örnek verir;
+    tüm karıncalar için tek bir vektörel argmax ile seçim yapılabilir.
+    """
+    
+    batched = True
+    
+    def __init__(self, rng):
+        """
+        Args:
+            rng: np.random.Generator
+        """
+        self.rng = rng
+    
+    def select(self, weights):
+        """
+        Ağırlıklarla orantılı olarak bir indeks seçer
+        
+        Args:
+            weights: Normalize edilmemiş, negatif olmayan ağırlıklar
+        
+        Returns:
+            int: Seçilen indeks
+        """
+        if not np.any(weights > 0):
+            return int(self.rng.integers(len(weights)))
+        with np.errstate(divide='ignore'):
+            log_weights = np.log(weights)
+        return int(np.argmax(log_weights + self.rng.gumbel(size=len(weights))))
+    
+    def select_log_batch(self, log_weights):
+        """
+        Her satır için log-ağırlıklarla orantılı bir indeks seçer
+        
+        Args:
+            log_weights: (m, n) log-ağırlıklar (-inf: seçilemez)
+        
+        Returns:
+            numpy.ndarray: (m,) seçilen indeksler
+        """
+        return np.argmax(log_weights + self.rng.gumbel(size=log_weights.shape), axis=1)
+    
+    def select_batch(self, weights):
+        """
+        Her satır için ağırlıklarla orantılı bir indeks seçer
+        
+        Args:
+            weights: (m, n) normalize edilmemiş ağırlıklar
+        
+        Returns:
+            numpy.ndarray: (m,) seçilen indeksler
+        """
+        with np.errstate(divide='ignore'):
+            return self.select_log_batch(np.log(weights))
+    
+    def get_state(self):
+        """Kontrol noktası için durum dizileri (tüm durum üreteçtedir)"""
+        return {}
+    
+    def set_state(self, state):
+        """get_state çıktısını geri yükler"""
+        pass
+
+
+SAMPLERS = {
+    'roulette': RouletteSampler,
+    'gumbel': GumbelSampler,
+}
+
+
+def make_sampler(name, rng):
+    """
+    İsme göre örnekleyici oluşturur
+    
+    Args:
+        name: 'roulette' veya 'gumbel'
+        rng: np.random.Generator
+    
+    Returns:
+        Örnekleyici nesnesi
+    """
+    if name not in SAMPLERS:
+        raise ValueError(f"Bilinmeyen örnekleyici: {name} (seçenekler: {', '.join(SAMPLERS)})")
+    return SAMPLERS[name](rng)
@@ -0,0 +1,73 @@
+"""
+Tur yardımcıları
+Mesafe matrisi veya DistanceOracle üzerinde tur uzunluğu ve pencereli 2-opt;
+optimizer, ayrıştırma çözücüsü ve artımlı yeniden optimizasyon ortak kullanır
+"""
+import numpy as np
+
+
+def edge_distances(distance_matrix, sources, targets):
+    """
+    Eşleşen kaynak/hedef çiftlerinin mesafeleri
+
+    Args:
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        sources: Kaynak indeksleri (skaler veya dizi, yayınlanır)
+        targets: Hedef indeksleri
+
+    Returns:
+        numpy.ndarray: Mesafeler (float64)
+    """
+    sources, targets = np.broadcast_arrays(np.asarray(sources, dtype=np.intp),
+                                           np.asarray(targets, dtype=np.intp))
+    return np.asarray(distance_matrix[sources, targets], dtype=np.float64)
+
+
+def tour_distance(distance_matrix, path):
+    """
+    Bir turun toplam mesafesini hesaplar
+
+    Args:
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        path: Şehir ziyaret sırası (başlangıca dönüş dahil)
+
+    Returns:
+        float: Toplam mesafe
+    """
+    path = np.asarray(path, dtype=np.intp)
+    if len(path) < 2:
+        return 0.0
+    # Sıralı toplama (Numba çekirdeğiyle bit düzeyinde aynı sonuç)
+    return float(np.cumsum(edge_distances(distance_matrix, path[:-1], path[1:]))[-1])
+
+
+def two_opt_window(path, distance_matrix, lo, hi):
+    """
+    path[lo:hi+1] aralığında 2-opt iyileştirmesi yapar (yerinde, tek geçiş)
+
+    Her i için a-b kenarıyla penceredeki tüm c-d kenarlarının değişim
+    kazancı vektörel hesaplanır ve en iyisi uygulanır. Simetrik mesafe
+    varsayar.
+
+    Args:
+        path: Tur (numpy.ndarray, yerinde değiştirilir)
+        distance_matrix: Mesafe matrisi veya DistanceOracle
+        lo: Pencere başlangıcı
+        hi: Pencere sonu (dahil)
+
+    Returns:
+        bool: Bir iyileştirme yapıldıysa True
+    """
+    improved = False
+    for i in range(lo, hi - 2):
+        a, b = path[i], path[i + 1]
+        c = path[i + 2:hi]
+        d = path[i + 3:hi + 1]
+        gains = (edge_distances(distance_matrix, a, b) + edge_distances(distance_matrix, c, d)
+                 - edge_distances(distance_matrix, a, c) - edge_distances(distance_matrix, b, d))
+        j = int(np.argmax(gains))
+        if gains[j] > 1e-9:
+            # path[i+1 .. i+2+j] ters çevrilir
+            path[i + 1:i + 3 + j] = path[i + 1:i + 3 + j][::-1]
+            improved = True
+    return improved
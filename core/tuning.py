@@ -0,0 +1,253 @@
+"""
+ACO hiperparametre ayarlama
+Rastgele/ızgara arama + ardışık yarılama (successive halving), süreç havuzunda paralel
+"""
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.exact import can_solve_exact, held_karp
+from core.variants import nearest_neighbor_tour
+
+# Streamlit kenar çubuğundaki aralıklar (iterasyon sayısı kaynak olarak kullanılır)
+DEFAULT_SEARCH_SPACE = {
+    'n_ants': list(range(10, 201, 10)),
+    'alpha': (0.1, 5.0, 0.1),
+    'beta': (0.1, 5.0, 0.1),
+    'evaporation_rate': (0.1, 0.9, 0.05),
+}
+
+# Parametre adı -> config.py ayar adı
+CONFIG_KEYS = {
+    'n_ants': 'DEFAULT_ANT_COUNT',
+    'n_iterations': 'DEFAULT_ITERATIONS',
+    'alpha': 'DEFAULT_ALPHA',
+    'beta': 'DEFAULT_BETA',
+    'evaporation_rate': 'DEFAULT_EVAPORATION_RATE',
+    'variant': 'DEFAULT_VARIANT',
+}
+
+TUNED_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 'tuned_config.json')
+
+# Worker süreçlerindeki örnek kümesi (her worker'a bir kez gönderilir)
+_worker_instances = None
+
+
+def random_configurations(space, n_configs, seed=None):
+    """
+    Arama uzayından rastgele konfigürasyonlar üretir
+
+    Args:
+        space: Parametre -> liste (ayrık seçenekler), (alt, üst) veya (alt, üst, adım) aralık
+        n_configs: Konfigürasyon sayısı
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        list: Konfigürasyon sözlükleri
+    """
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n_configs):
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                value = float(rng.uniform(values[0], values[1]))
+                if len(values) == 3:
+                    # Kenar çubuğundaki kaydırıcı adımlarına yuvarla
+                    value = values[0] + round((value - values[0]) / values[2]) * values[2]
+                config[name] = round(value, 3)
+            else:
+                config[name] = values[int(rng.integers(len(values)))]
+        configs.append(config)
+    return configs
+
+
+def _grid_values(name, values):
+    """
+    Izgara aramasında bir parametrenin seçenekleri
+
+    Liste olduğu gibi kullanılır; (alt, üst, adım) aralığı kaydırıcı
+    adımlarına açılır. Adımsız (alt, üst) aralık ızgarada tanımsızdır.
+    """
+    if not isinstance(values, tuple):
+        return list(values)
+    if len(values) != 3:
+        raise ValueError(f"Izgara araması için '{name}' aralığının adımı olmalı: (alt, üst, adım)")
+    low, high, step = values
+    return [round(float(value), 3) for value in np.arange(low, high + step / 2, step)]
+
+
+def grid_configurations(space):
+    """
+    Seçeneklerin tüm kombinasyonlarını üretir
+
+    Args:
+        space: Parametre -> seçenek listesi veya (alt, üst, adım) aralık
+
+    Returns:
+        list: Konfigürasyon sözlükleri
+    """
+    names = list(space)
+    choices = [_grid_values(name, space[name]) for name in names]
+    return [dict(zip(names, values)) for values in itertools.product(*choices)]
+
+
+def _init_worker(instances):
+    """Worker süreci başlatıcısı: örnek kümesini saklar"""
+    global _worker_instances
+    _worker_instances = instances
+
+
+def _evaluate(task):
+    """
+    Bir konfigürasyonu bir örnek üzerinde çalıştırır (worker içinde)
+
+    Returns:
+        tuple: (konfigürasyon indeksi, normalize mesafe)
+    """
+    config_idx, config, instance_idx, n_iterations, seed = task
+    distance_matrix, reference = _worker_instances[instance_idx]
+
+    params = dict(config)
+    params.pop('n_iterations', None)
+    # Kesin çözüm kısayolu kapalı: ayarlanan ACO'nun kendisidir
+    optimizer = AntColonyOptimizer(distance_matrix, n_iterations=n_iterations,
+                                   seed=seed, verbose=False, exact_threshold=0, **params)
+    _, best_distance, _ = optimizer.solve(start_city=0)
+    return config_idx, best_distance / reference
+
+
+def successive_halving(distance_matrices, configs, min_iterations=10, max_iterations=100,
+                       eta=3, n_workers=None, seed=0):
+    """
+    Konfigürasyonları ardışık yarılama ile eler
+
+    Her turda hayatta kalan konfigürasyonlar tüm örneklerde aynı iterasyon
+    bütçesiyle çalıştırılır, en iyi 1/eta kısmı bir sonraki tura eta kat
+    bütçeyle geçer. Skor, her örnekte referans tura göre normalize edilmiş
+    mesafelerin ortalamasıdır (küçük daha iyi). Referans, kesin çözülebilen
+    küçük örneklerde Held-Karp optimumu (skor 1.0 = optimal), diğerlerinde
+    en yakın komşu turudur.
+
+    Args:
+        distance_matrices: Örnek mesafe matrisleri listesi
+        configs: Konfigürasyon sözlükleri
+        min_iterations: İlk turdaki iterasyon bütçesi
+        max_iterations: Son turdaki iterasyon bütçesi
+        eta: Eleme oranı
+        n_workers: Süreç sayısı (None ise CPU sayısı)
+        seed: Örnek başına tohumların tabanı
+
+    Returns:
+        dict: best_config, best_score ve tur geçmişi (history)
+    """
+    instances = []
+    for distance_matrix in distance_matrices:
+        distance_matrix = np.asarray(distance_matrix)
+        if can_solve_exact(len(distance_matrix)):
+            _, reference = held_karp(distance_matrix)
+        else:
+            _, reference = nearest_neighbor_tour(distance_matrix)
+        instances.append((distance_matrix, reference))
+
+    survivors = list(range(len(configs)))
+    budget = min_iterations
+    history = []
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(instances,)) as pool:
+        while True:
+            tasks = [(config_idx, configs[config_idx], instance_idx, budget, seed + instance_idx)
+                     for config_idx in survivors
+                     for instance_idx in range(len(instances))]
+
+            totals = {config_idx: 0.0 for config_idx in survivors}
+            for config_idx, score in pool.map(_evaluate, tasks):
+                totals[config_idx] += score
+            scores = {config_idx: total / len(instances) for config_idx, total in totals.items()}
+
+            ranked = sorted(survivors, key=scores.get)
+            history.append({
+                'iterations': budget,
+                'scores': [(configs[config_idx], scores[config_idx]) for config_idx in ranked],
+            })
+            print(f"Bütçe {budget} iterasyon: {len(survivors)} konfigürasyon, "
+                  f"en iyi skor = {scores[ranked[0]]:.4f}")
+
+            if budget >= max_iterations or len(survivors) == 1:
+                break
+
+            survivors = ranked[:max(1, len(survivors) // eta)]
+            budget = min(budget * eta, max_iterations)
+
+    best_idx = ranked[0]
+    best_config = dict(configs[best_idx])
+    best_config['n_iterations'] = budget
+    return {'best_config': best_config, 'best_score': scores[best_idx], 'history': history}
+
+
+def tune(distance_matrices, space=None, n_configs=27, search='random', min_iterations=10,
+         max_iterations=100, eta=3, n_workers=None, seed=0):
+    """
+    Rastgele veya ızgara arama ile ardışık yarılama yapar
+
+    Args:
+        distance_matrices: Örnek mesafe matrisleri listesi
+        space: Arama uzayı (None ise DEFAULT_SEARCH_SPACE)
+        n_configs: Rastgele aramada konfigürasyon sayısı
+        search: 'random' veya 'grid'
+        min_iterations, max_iterations, eta, n_workers, seed: successive_halving parametreleri
+
+    Returns:
+        dict: best_config, best_score ve history
+    """
+    space = space or DEFAULT_SEARCH_SPACE
+    if search == 'random':
+        configs = random_configurations(space, n_configs, seed)
+    elif search == 'grid':
+        configs = grid_configurations(space)
+    else:
+        raise ValueError(f"Bilinmeyen arama yöntemi: {search} (seçenekler: random, grid)")
+
+    return successive_halving(distance_matrices, configs, min_iterations, max_iterations,
+                              eta=eta, n_workers=n_workers, seed=seed)
+
+
+def save_tuned_defaults(best_config, path=TUNED_CONFIG_PATH):
+    """
+    Kazanan konfigürasyonu config.py'nin yükleyeceği varsayılanlar olarak kaydeder
+
+    Değerler kenar çubuğu aralıklarına sıkıştırılır (ör. 10'dan küçük
+    iterasyon bütçesi 10 olur).
+
+    Args:
+        best_config: Parametre sözlüğü (ör. tune() sonucundaki best_config)
+        path: JSON dosya yolu
+
+    Returns:
+        dict: Kaydedilen ayarlar
+    """
+    from config import clamp_tuned_defaults
+
+    defaults = clamp_tuned_defaults({CONFIG_KEYS[name]: value for name, value in best_config.items()
+                                     if name in CONFIG_KEYS})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(defaults, f, indent=2, ensure_ascii=False)
+    return defaults
+
+
+if __name__ == "__main__":
+    from core.haversine import haversine_matrix
+    from data.coordinates import create_sample_data
+    from data.store_set import StoreSet
+
+    stores = StoreSet.from_dataframe(create_sample_data())
+    result = tune([haversine_matrix(stores.coords)])
+    print(f"En iyi konfigürasyon: {result['best_config']} (skor = {result['best_score']:.4f})")
+    save_tuned_defaults(result['best_config'])
+    print(f"Varsayılanlar kaydedildi: {TUNED_CONFIG_PATH}")
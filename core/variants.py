@@ -0,0 +1,341 @@
+"""
+ACO varyantları (strateji sınıfları)
+Ant System, Ant Colony System, MAX-MIN Ant System ve sıralama tabanlı Ant System
+"""
+import numpy as np
+
+from core import numba_backend
+from core.sampling import RouletteSampler
+
+
+def nearest_neighbor_tour(distance_matrix, start_city=0, candidates=None):
+    """
+    En yakın komşu sezgiseli ile bir tur oluşturur
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n) veya DistanceOracle
+        start_city: Başlangıç şehri indeksi
+        candidates: (n, k) aday listeleri; verilirse önce ziyaret edilmemiş
+            adaylara bakılır, tam satır sadece adaylar tükenince okunur
+
+    Returns:
+        list: Şehir ziyaret sırası (başlangıca dönüş dahil)
+        float: Toplam mesafe
+    """
+    n = len(distance_matrix)
+    visited = np.zeros(n, dtype=bool)
+    visited[start_city] = True
+    path = [start_city]
+    total = 0.0
+    current = start_city
+
+    for _ in range(n - 1):
+        options = candidates[current][~visited[candidates[current]]] if candidates is not None else ()
+        if len(options):
+            distances = np.asarray(distance_matrix[current, options], dtype=np.float64)
+            best = int(np.argmin(distances))
+            next_city = int(options[best])
+            total += distances[best]
+        else:
+            row = np.array(distance_matrix[current], dtype=np.float64)
+            row[visited] = np.inf
+            next_city = int(np.argmin(row))
+            total += row[next_city]
+        visited[next_city] = True
+        path.append(next_city)
+        current = next_city
+
+    total += float(distance_matrix[current, start_city])
+    path.append(start_city)
+    return path, total
+
+
+class AntSystem:
+    """
+    Temel Ant System: tüm karıncalar feromon bırakır, sınır yoktur
+    """
+
+    name = 'as'
+    custom_construction = False
+
+    def initialize(self, optimizer, start_city):
+        """Çalıştırma başında feromonu hazırlar"""
+        pass
+
+    def construct_iteration(self, optimizer, start_city):
+        """
+        Varyanta özel toplu tur oluşturma
+
+        Returns:
+            tuple: (yollar, mesafeler) veya optimizer'ın kendi yolu kullanılacaksa None
+        """
+        return None
+
+    def choose(self, optimizer, weights):
+        """
+        Ağırlıklara göre bir sonraki şehrin indeksini seçer
+
+        Args:
+            optimizer: AntColonyOptimizer
+            weights: Normalize edilmemiş seçim ağırlıkları
+
+        Returns:
+            int: Seçilen indeks
+        """
+        return optimizer.sampler.select(weights)
+
+    def local_update(self, optimizer, city_from, city_to):
+        """Bir kenar geçildikten hemen sonra yapılan güncelleme"""
+        pass
+
+    def update(self, optimizer, paths, distances):
+        """
+        İterasyon sonunda feromonu günceller
+
+        Args:
+            optimizer: AntColonyOptimizer
+            paths: Tüm karıncaların yolları
+            distances: Tüm karıncaların mesafeleri
+        """
+        optimizer.update_pheromone(paths, distances)
+
+    def get_state(self):
+        """Kontrol noktası için varyant durumu (JSON'a yazılabilir değerler)"""
+        return dict(vars(self))
+
+    def set_state(self, state):
+        """get_state çıktısını geri yükler"""
+        vars(self).update(state)
+
+
+class AntColonySystem(AntSystem):
+    """
+    Ant Colony System (Dorigo & Gambardella)
+
+    q0 olasılıkla en çekici şehir seçilir (sömürü), aksi halde rulet seçimi
+    yapılır. Geçilen her kenarda yerel güncelleme feromonu τ0'a çeker;
+    iterasyon sonunda sadece en iyi tur güncellenir. Yoğun feromonda
+    karıncalar aynı adımda ilerler ve yerel güncelleme adım adım toplu
+    uygulanır (NumPy ile vektörel, Numba yüklüyse derlenmiş çekirdek).
+    """
+
+    name = 'acs'
+    custom_construction = True
+
+    def __init__(self, q0=0.9, xi=0.1):
+        """
+        Args:
+            q0: Sömürü (argmax) olasılığı
+            xi: Yerel feromon güncelleme oranı
+        """
+        self.q0 = q0
+        self.xi = xi
+        self.tau0 = None
+
+    def initialize(self, optimizer, start_city):
+        _, nn_distance = nearest_neighbor_tour(optimizer.distance_matrix, start_city, optimizer.candidates)
+        self.tau0 = optimizer.q / (optimizer.n_cities * nn_distance)
+        optimizer.pheromone.fill(self.tau0)
+
+    def construct_iteration(self, optimizer, start_city):
+        # Aday listeleriyle karıncalar sırayla ilerler (adım başına O(k))
+        if optimizer.candidates is not None:
+            return None
+
+        n, m = optimizer.n_cities, optimizer.n_ants
+        exploit = optimizer.rng.random((n - 1, m)) < self.q0
+        roulette = isinstance(optimizer.sampler, RouletteSampler)
+        uniforms = optimizer.sampler.take((n - 1) * m).reshape(n - 1, m) if roulette else None
+
+        if optimizer.backend == 'numba':
+            paths = numba_backend.construct_tours_acs(
+                optimizer.distance_matrix, optimizer.pheromone.values, float(optimizer.alpha),
+                float(optimizer.beta), start_city, m, exploit, uniforms, float(self.xi), float(self.tau0)
+            )
+            distances = numba_backend.evaluate_tours(optimizer.distance_matrix, paths)
+            return paths.tolist(), distances.tolist()
+
+        ants = np.arange(m)
+        paths = np.empty((m, n + 1), dtype=np.intp)
+        paths[:, 0] = start_city
+        paths[:, -1] = start_city
+        visited = np.zeros((m, n), dtype=bool)
+        visited[:, start_city] = True
+        current = paths[:, 0].copy()
+
+        for step in range(1, n):
+            weights = (optimizer.pheromone.rows(current).astype(np.float64) ** optimizer.alpha
+                       * (1.0 / (optimizer.distance_matrix[current].astype(np.float64) + 1e-10)) ** optimizer.beta)
+            weights[visited] = 0.0
+            greedy = np.argmax(np.where(visited, -1.0, weights), axis=1)
+
+            if roulette:
+                cumulative = np.cumsum(weights, axis=1)
+                total = cumulative[:, -1]
+                sampled = np.count_nonzero(cumulative <= (uniforms[step - 1] * total)[:, np.newaxis], axis=1)
+                # Yuvarlama nedeniyle sona taşarsa son ziyaret edilmemiş şehir
+                last = n - 1 - np.argmax(~visited[:, ::-1], axis=1)
+                sampled = np.minimum(sampled, last)
+                # Sönmüş satırlar: ziyaret edilmemişler arasında düzgün seçim
+                for ant in np.flatnonzero(~(total > 0)):
+                    options = np.flatnonzero(~visited[ant])
+                    sampled[ant] = options[int(uniforms[step - 1, ant] * len(options))]
+            else:
+                with np.errstate(divide='ignore'):
+                    log_weights = np.log(weights)
+                log_weights[visited] = -np.inf
+                dead = ~np.isfinite(log_weights.max(axis=1))
+                if np.any(dead):
+                    log_weights[dead] = np.where(visited[dead], -np.inf, 0.0)
+                sampled = optimizer.sampler.select_log_batch(log_weights)
+
+            chosen = np.where(exploit[step - 1], greedy, sampled)
+            optimizer.pheromone.blend_edges(current, chosen, self.xi, self.tau0)
+            visited[ants, chosen] = True
+            paths[:, step] = chosen
+            current = chosen
+
+        distances = np.cumsum(optimizer.distance_matrix[paths[:, :-1], paths[:, 1:]], axis=1,
+                              dtype=np.float64)[:, -1]
+        return paths.tolist(), distances.tolist()
+
+    def choose(self, optimizer, weights):
+        if optimizer.rng.random() < self.q0:
+            return int(np.argmax(weights))
+        return optimizer.sampler.select(weights)
+
+    def local_update(self, optimizer, city_from, city_to):
+        optimizer.pheromone.blend([city_from, city_to], self.xi, self.tau0)
+
+    def update(self, optimizer, paths, distances):
+        if optimizer.best_path is None or not optimizer.best_distance > 0:
+            return
+        optimizer.pheromone.blend(optimizer.best_path, optimizer.evaporation_rate,
+                                  optimizer.q / optimizer.best_distance)
+
+
+class MaxMinAntSystem(AntSystem):
+    """
+    MAX-MIN Ant System (Stützle & Hoos)
+
+    Sadece iterasyonun en iyi karıncası feromon bırakır, feromon
+    [τmin, τmax] aralığında tutulur ve durağanlıkta τmax'a sıfırlanır.
+    """
+
+    name = 'mmas'
+
+    def __init__(self, p_best=0.05, stagnation_limit=20):
+        """
+        Args:
+            p_best: τmin hesabında en iyi turu yeniden kurma olasılığı
+            stagnation_limit: İyileşme olmadan geçen bu kadar iterasyonda yeniden başlatma
+        """
+        self.p_best = p_best
+        self.stagnation_limit = stagnation_limit
+        self.tau_max = None
+        self.tau_min = None
+        self._last_best = float('inf')
+        self._stagnant_iterations = 0
+
+    def _set_limits(self, optimizer, best_distance):
+        """En iyi mesafeye göre τmax ve τmin değerlerini hesaplar"""
+        n = optimizer.n_cities
+        self.tau_max = optimizer.q / (optimizer.evaporation_rate * best_distance)
+        if n > 2:
+            p_dec = self.p_best ** (1.0 / n)
+            self.tau_min = min(self.tau_max * (1 - p_dec) / ((n / 2 - 1) * p_dec), self.tau_max)
+        else:
+            self.tau_min = 0.0
+
+    def initialize(self, optimizer, start_city):
+        _, nn_distance = nearest_neighbor_tour(optimizer.distance_matrix, start_city, optimizer.candidates)
+        self._set_limits(optimizer, nn_distance)
+        optimizer.pheromone.fill(self.tau_max)
+        self._last_best = float('inf')
+        self._stagnant_iterations = 0
+
+    def update(self, optimizer, paths, distances):
+        optimizer.pheromone.evaporate(optimizer.evaporation_rate)
+
+        # Sadece iterasyonun en iyisi feromon bırakır
+        best_idx = int(np.argmin(distances))
+        if distances[best_idx] > 0:
+            optimizer.pheromone.deposit(paths[best_idx], optimizer.q / distances[best_idx])
+
+        self._set_limits(optimizer, optimizer.best_distance)
+        optimizer.pheromone.clip(self.tau_min, self.tau_max)
+
+        # Durağanlık kontrolü ve yeniden başlatma
+        if optimizer.best_distance < self._last_best:
+            self._last_best = optimizer.best_distance
+            self._stagnant_iterations = 0
+        else:
+            self._stagnant_iterations += 1
+            if self._stagnant_iterations >= self.stagnation_limit:
+                optimizer.pheromone.fill(self.tau_max)
+                self._stagnant_iterations = 0
+
+
+class RankBasedAntSystem(AntSystem):
+    """
+    Sıralama tabanlı Ant System (Bullnheimer vd.)
+
+    En iyi (w - 1) karınca sıralarına göre ağırlıklı, şimdiye kadarki
+    en iyi tur ise w ağırlığıyla feromon bırakır. Başlangıç feromonu
+    bırakma miktarlarıyla aynı ölçekte seçilir; aksi halde ilk güncelleme
+    başlangıç düzeyini bastırır ve koloni tek tura kilitlenir.
+    """
+
+    name = 'rank'
+
+    def __init__(self, weight=6):
+        """
+        Args:
+            weight: Sıralama ağırlığı w
+        """
+        self.weight = weight
+        self.tau0 = None
+
+    def initialize(self, optimizer, start_city):
+        # τ0 = 0.5·w·(w-1)·Q / (ρ·L_nn): bir iterasyonun toplam bırakımının buharlaşma dengesi
+        _, nn_distance = nearest_neighbor_tour(optimizer.distance_matrix, start_city, optimizer.candidates)
+        self.tau0 = 0.5 * self.weight * (self.weight - 1) * optimizer.q / (optimizer.evaporation_rate * nn_distance)
+        optimizer.pheromone.fill(self.tau0)
+
+    def update(self, optimizer, paths, distances):
+        optimizer.pheromone.evaporate(optimizer.evaporation_rate)
+
+        order = np.argsort(distances, kind='stable')[:self.weight - 1]
+        for rank, idx in enumerate(order, start=1):
+            if distances[idx] > 0:
+                optimizer.pheromone.deposit(paths[idx], (self.weight - rank) * optimizer.q / distances[idx])
+
+        if optimizer.best_path is not None and optimizer.best_distance > 0:
+            optimizer.pheromone.deposit(optimizer.best_path,
+                                        self.weight * optimizer.q / optimizer.best_distance)
+
+
+VARIANTS = {
+    'as': AntSystem,
+    'acs': AntColonySystem,
+    'mmas': MaxMinAntSystem,
+    'rank': RankBasedAntSystem,
+}
+
+
+def make_variant(variant, **params):
+    """
+    İsme göre ACO varyantı oluşturur
+
+    Args:
+        variant: 'as', 'acs', 'mmas', 'rank' veya hazır bir strateji nesnesi
+        **params: Varyant parametreleri (ör. q0=0.9)
+
+    Returns:
+        Strateji nesnesi
+    """
+    if not isinstance(variant, str):
+        return variant
+    if variant not in VARIANTS:
+        raise ValueError(f"Bilinmeyen ACO varyantı: {variant} (seçenekler: {', '.join(VARIANTS)})")
+    return VARIANTS[variant](**params)
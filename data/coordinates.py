@@ -146,20 +146,18 @@ def create_sample_data():
     
     return pd.DataFrame(stores)
 
-def get_coordinates_from_dataframe(df):
+def find_coordinate_columns(df):
     """
-    DataFrame'den koordinatları çıkarır
+    DataFrame'deki enlem/boylam sütunlarını bulur (farklı isimler olabilir)
     
     Args:
         df: Mağaza bilgilerini içeren DataFrame
     
     Returns:
-        tuple: (names, latitudes, longitudes) listeleri
+        tuple: (lat_col, lon_col), bulunamayan sütun None
     """
-    # Koordinat sütunlarını bul (farklı isimler olabilir)
     lat_col = None
     lon_col = None
-    name_col = None
     
     for col in df.columns:
         col_lower = col.lower()
@@ -167,11 +165,32 @@ def get_coordinates_from_dataframe(df):
             lat_col = col
         elif 'lon' in col_lower or 'boylam' in col_lower or 'lng' in col_lower:
             lon_col = col
-        elif 'name' in col_lower or 'isim' in col_lower or 'mağaza' in col_lower:
+    
+    return lat_col, lon_col
+
+def get_coordinates_from_dataframe(df):
+    """
+    DataFrame'den koordinatları çıkarır
+    
+    Args:
+        df: Mağaza bilgilerini içeren DataFrame
+    
+    Returns:
+        tuple: (names, latitudes, longitudes) listeleri
+    """
+    lat_col, lon_col = find_coordinate_columns(df)
+    name_col = None
+    
+    for col in df.columns:
+        col_lower = col.lower()
+        if col in (lat_col, lon_col):
+            continue
+        if 'name' in col_lower or 'isim' in col_lower or 'mağaza' in col_lower:
             name_col = col
     
     if lat_col is None or lon_col is None:
-        raise ValueError("DataFrame'de koordinat sütunları bulunamadı")
+        raise ValueError("DataFrame'de koordinat sütunları bulunamadı "
+                         "(adres sütunu varsa data.geocoding.fill_missing_coordinates ile doldurun)")
     
     names = df[name_col].values if name_col else [f"Mağaza {i+1}" for i in range(len(df))]
     latitudes = df[lat_col].values
@@ -0,0 +1,324 @@
+"""
+Koordinatı olmayan mağazalar için toplu, önbellekli adres çözümleme (geocoding)
+Eksik koordinatlar eşzamanlı, hız sınırlı ve yeniden denemeli olarak çözülür;
+her adres kalıcı önbellekte (SQLite) saklandığından yalnızca bir kez sorgulanır
+"""
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data.sqlite_utils import connect
+
+
+def normalize_address(address):
+    """Önbellek anahtarı için adresi sadeleştirir (boşluk ve büyük/küçük harf)"""
+    return ' '.join(str(address).split()).casefold()
+
+
+def find_address_column(df):
+    """
+    DataFrame'deki adres sütununu bulur
+
+    Returns:
+        str: Sütun adı veya None
+    """
+    for col in df.columns:
+        col_lower = col.lower()
+        if 'address' in col_lower or 'adres' in col_lower:
+            return col
+    return None
+
+
+class GoogleGeocoder:
+    """
+    Google Maps Geocoding API ile adres çözümleyici
+    """
+
+    def __init__(self, api_key=None, client=None):
+        """
+        Args:
+            api_key: Google Maps API anahtarı (None ise get_api_key ile aranır)
+            client: Hazır googlemaps.Client (verilirse api_key kullanılmaz)
+        """
+        if client is None:
+            import googlemaps
+            from core.matrix_utils import get_api_key
+
+            api_key = api_key or get_api_key()
+            if not api_key:
+                raise ValueError("Adres çözümleme için Google Maps API anahtarı gerekli")
+            client = googlemaps.Client(key=api_key)
+        self.client = client
+        self.name = 'google'
+
+    def __call__(self, address):
+        """
+        Args:
+            address: Adres metni
+
+        Returns:
+            tuple: (enlem, boylam) veya bulunamazsa None
+        """
+        results = self.client.geocode(address)
+        if not results:
+            return None
+        location = results[0]['geometry']['location']
+        return float(location['lat']), float(location['lng'])
+
+
+class LocalGeocoder:
+    """
+    Ağ erişimi gerektirmeyen yerel adres çözümleyici (testler ve demo için)
+
+    Bilinen adresler sözlükten döner; diğerleri adresin özetinden merkez
+    etrafında belirlenimci (her çalıştırmada aynı) koordinatlara eşlenir.
+    """
+
+    def __init__(self, known=None, center=(36.8841, 30.7056), spread=0.05, delay=0.0):
+        """
+        Args:
+            known: Adres -> (enlem, boylam) sözlüğü
+            center: Bilinmeyen adresler için merkez (varsayılan Muratpaşa)
+            spread: Merkezden en fazla sapma (derece); 0 ise bilinmeyenler None döner
+            delay: Her çağrıda beklenecek süre (ağ gecikmesi benzetimi, saniye)
+        """
+        self.known = {normalize_address(address): coords for address, coords in (known or {}).items()}
+        self.center = center
+        self.spread = spread
+        self.delay = delay
+        self.name = 'local'
+
+    def __call__(self, address):
+        if self.delay:
+            time.sleep(self.delay)
+        key = normalize_address(address)
+        if key in self.known:
+            return tuple(self.known[key])
+        if not self.spread:
+            return None
+        digest = hashlib.sha256(key.encode()).digest()
+        u = np.frombuffer(digest[:16], dtype=np.uint64) / float(2 ** 64)
+        return (self.center[0] + (2 * u[0] - 1) * self.spread,
+                self.center[1] + (2 * u[1] - 1) * self.spread)
+
+
+class RateLimiter:
+    """
+    İş parçacıkları arasında paylaşılan hız sınırlayıcı
+
+    Çağrılar en az 1 / rate saniye aralıkla başlar.
+    """
+
+    def __init__(self, rate):
+        """
+        Args:
+            rate: Saniyedeki en fazla istek (None veya 0 ise sınırsız)
+        """
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Sıradaki istek zamanı gelene kadar bekler"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class GeocodeCache:
+    """
+    SQLite tabanlı kalıcı adres -> koordinat önbelleği
+
+    Anahtar normalize edilmiş adrestir; bulunamayan adresler de kaydedilir
+    (tekrar tekrar sorgulanmaz). Her işlem kendi bağlantısını açar.
+    """
+
+    def __init__(self, path='geocode_cache.db'):
+        """
+        Args:
+            path: SQLite dosya yolu
+        """
+        self.path = path
+        with connect(self.path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS geocodes (
+                    address TEXT PRIMARY KEY,
+                    latitude REAL,
+                    longitude REAL,
+                    provider TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def get_many(self, addresses):
+        """
+        Önbellekteki adresleri döndürür
+
+        Args:
+            addresses: Normalize edilmiş adresler
+
+        Returns:
+            dict: Adres -> (enlem, boylam) veya None (bulunamadı olarak kayıtlı)
+        """
+        addresses = list(addresses)
+        found = {}
+        with connect(self.path) as conn:
+            # SQLite parametre sınırı için parça parça sorgulanır
+            for start in range(0, len(addresses), 500):
+                chunk = addresses[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT address, latitude, longitude FROM geocodes WHERE address IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for address, latitude, longitude in rows:
+                    found[address] = None if latitude is None else (latitude, longitude)
+        return found
+
+    def put_many(self, results, provider=None):
+        """
+        Çözümleme sonuçlarını kaydeder
+
+        Args:
+            results: Normalize adres -> (enlem, boylam) veya None
+            provider: Çözümleyici adı
+        """
+        now = time.time()
+        with connect(self.path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO geocodes (address, latitude, longitude, provider, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(address, None if coords is None else float(coords[0]),
+                  None if coords is None else float(coords[1]), provider, now)
+                 for address, coords in results.items()]
+            )
+
+    def clear(self):
+        """Tüm kayıtları siler"""
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM geocodes")
+
+
+def _geocode_with_retry(geocoder, address, limiter, max_retries, backoff):
+    """Tek adresi hız sınırıyla çözer, hata olursa üstel bekleyerek yeniden dener"""
+    for attempt in range(max_retries + 1):
+        limiter.wait()
+        try:
+            return geocoder(address)
+        except Exception:
+            if attempt == max_retries:
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+
+def geocode_addresses(addresses, geocoder, cache=None, max_workers=None, rate_limit=None,
+                      max_retries=None, backoff=0.5):
+    """
+    Adresleri toplu olarak koordinatlara çevirir
+
+    Tekrarlanan adresler bir kez, önbellekte olanlar hiç sorgulanmaz; kalanlar
+    iş parçacığı havuzunda, ortak hız sınırıyla ve yeniden denemeyle çözülür.
+    Yeniden denemelere rağmen hata veren adresler önbelleğe yazılmaz
+    (sonraki çalıştırmada tekrar denenir).
+
+    Args:
+        addresses: Adres listesi
+        geocoder: address -> (enlem, boylam) veya None döndüren çağrılabilir nesne
+            (None ise sadece önbellek kullanılır; önbellekte olmayanlar sonuçta yer almaz)
+        cache: GeocodeCache (None ise önbellek kullanılmaz)
+        max_workers: Eşzamanlı istek sayısı (None ise config.GEOCODE_WORKERS)
+        rate_limit: Saniyedeki en fazla istek (None ise config.GEOCODE_RATE_LIMIT)
+        max_retries: Hata başına yeniden deneme (None ise config.GEOCODE_MAX_RETRIES)
+        backoff: İlk yeniden deneme beklemesi (saniye, her denemede iki katına çıkar)
+
+    Returns:
+        dict: Normalize adres -> (enlem, boylam) veya None
+    """
+    from config import GEOCODE_MAX_RETRIES, GEOCODE_RATE_LIMIT, GEOCODE_WORKERS
+
+    max_workers = GEOCODE_WORKERS if max_workers is None else max_workers
+    rate_limit = GEOCODE_RATE_LIMIT if rate_limit is None else rate_limit
+    max_retries = GEOCODE_MAX_RETRIES if max_retries is None else max_retries
+
+    # Normalize adres -> ilk görülen yazım
+    unique = {}
+    for address in addresses:
+        unique.setdefault(normalize_address(address), str(address))
+
+    results = cache.get_many(unique) if cache is not None else {}
+    missing = [key for key in unique if key not in results]
+    if not missing or geocoder is None:
+        return results
+
+    limiter = RateLimiter(rate_limit)
+    resolved = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {key: pool.submit(_geocode_with_retry, geocoder, unique[key], limiter, max_retries, backoff)
+                   for key in missing}
+        for key, future in futures.items():
+            try:
+                resolved[key] = future.result()
+            except Exception as e:
+                print(f"Adres çözümlenemedi ({unique[key]}): {e}")
+                results[key] = None
+
+    if cache is not None and resolved:
+        cache.put_many(resolved, provider=getattr(geocoder, 'name', None))
+    results.update(resolved)
+    return results
+
+
+def fill_missing_coordinates(df, geocoder, cache=None, **kwargs):
+    """
+    Koordinatı olmayan satırları adres sütunundan çözümleyerek doldurur
+
+    Enlem/boylam sütunları yoksa 'latitude' ve 'longitude' olarak eklenir;
+    varsa sadece boş hücreler doldurulur.
+
+    Args:
+        df: Mağaza bilgilerini içeren DataFrame
+        geocoder: Adres çözümleyici (GoogleGeocoder, LocalGeocoder, çağrılabilir nesne
+            veya sadece önbellek için None)
+        cache: GeocodeCache
+        **kwargs: geocode_addresses parametreleri
+
+    Returns:
+        pandas.DataFrame: Koordinatları doldurulmuş kopya
+    """
+    from data.coordinates import find_coordinate_columns
+
+    lat_col, lon_col = find_coordinate_columns(df)
+    df = df.copy()
+    if lat_col is None or lon_col is None:
+        lat_col, lon_col = 'latitude', 'longitude'
+        df[lat_col] = np.nan
+        df[lon_col] = np.nan
+
+    missing = df[lat_col].isna() | df[lon_col].isna()
+    if not missing.any():
+        return df
+
+    address_col = find_address_column(df)
+    if address_col is None:
+        raise ValueError("Eksik koordinatlar için DataFrame'de adres sütunu bulunamadı")
+
+    addresses = df.loc[missing, address_col]
+    results = geocode_addresses(addresses[addresses.notna()], geocoder, cache=cache, **kwargs)
+
+    # Sadece çözümlenen satırlar yazılır; çözümlenemeyenler eksik kalır
+    coords = {index: results.get(normalize_address(address))
+              for index, address in addresses.items() if pd.notna(address)}
+    coords = {index: value for index, value in coords.items() if value is not None}
+    if coords:
+        df.loc[list(coords), lat_col] = [value[0] for value in coords.values()]
+        df.loc[list(coords), lon_col] = [value[1] for value in coords.values()]
+    return df
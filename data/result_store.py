@@ -0,0 +1,172 @@
+"""
+Çözüm sonuçları için kalıcı önbellek (SQLite)
+Aynı matris, parametreler, varyant ve tohumla yapılan çözümler tekrar çalıştırılmaz
+"""
+import hashlib
+import json
+import time
+
+import numpy as np
+
+from data.sqlite_utils import connect
+
+
+def matrix_hash(distance_matrix):
+    """
+    Mesafe matrisinin içerik özetini hesaplar
+
+    Args:
+        distance_matrix: Mesafe matrisi (n x n, np.memmap olabilir)
+
+    Returns:
+        str: SHA-256 özeti
+    """
+    matrix = np.ascontiguousarray(distance_matrix)
+    digest = hashlib.sha256()
+    digest.update(f"{matrix.shape}|{matrix.dtype.str}".encode())
+    # Büyük matrisler satır blokları halinde okunur
+    for start in range(0, len(matrix), 1024):
+        digest.update(matrix[start:start + 1024].tobytes())
+    return digest.hexdigest()
+
+
+def solve_key(distance_matrix, params, variant='as', seed=None, start_city=0):
+    """
+    Bir çözüm isteğinin önbellek anahtarını oluşturur
+
+    Args:
+        distance_matrix: Mesafe matrisi
+        params: Optimizer parametreleri (n_ants, alpha, ...)
+        variant: ACO varyantı
+        seed: Rastgele sayı üreteci tohumu
+        start_city: Başlangıç şehri indeksi
+
+    Returns:
+        str: Anahtar
+    """
+    request = json.dumps({
+        'matrix': matrix_hash(distance_matrix),
+        'params': params,
+        'variant': variant,
+        'seed': seed,
+        'start_city': start_city,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(request.encode()).hexdigest()
+
+
+class ResultStore:
+    """
+    SQLite tabanlı, boyutu sınırlı çözüm önbelleği
+
+    En uzun süredir kullanılmayan kayıtlar max_entries aşıldığında silinir.
+    Her işlem kendi bağlantısını açar (Streamlit oturumları arasında güvenli).
+    """
+
+    def __init__(self, path='results.db', max_entries=500):
+        """
+        Args:
+            path: SQLite dosya yolu
+            max_entries: Saklanacak en fazla kayıt sayısı
+        """
+        self.path = path
+        self.max_entries = max_entries
+        with connect(self.path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    key TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    n_cities INTEGER NOT NULL,
+                    variant TEXT,
+                    seed INTEGER,
+                    params TEXT NOT NULL,
+                    best_path TEXT NOT NULL,
+                    best_distance REAL NOT NULL,
+                    iteration_distances TEXT NOT NULL
+                )
+            """)
+
+    def get(self, key):
+        """
+        Anahtara ait sonucu döndürür
+
+        Args:
+            key: solve_key ile oluşturulmuş anahtar
+
+        Returns:
+            tuple: (best_path, best_distance, iteration_distances) veya None
+        """
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT best_path, best_distance, iteration_distances FROM runs WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE runs SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                         (time.time(), key))
+        return json.loads(row[0]), row[1], json.loads(row[2])
+
+    def put(self, key, result, params, variant='as', seed=None):
+        """
+        Sonucu kaydeder ve gerekirse eski kayıtları siler
+
+        Args:
+            key: solve_key ile oluşturulmuş anahtar
+            result: (best_path, best_distance, iteration_distances)
+            params: Optimizer parametreleri
+            variant: ACO varyantı
+            seed: Rastgele sayı üreteci tohumu
+        """
+        best_path, best_distance, iteration_distances = result
+        now = time.time()
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (key, created_at, last_used_at, hits, n_cities, variant, seed, "
+                "params, best_path, best_distance, iteration_distances) VALUES (?, ?, ?, 0, ?, ?, ?, ?, ?, ?, ?)",
+                (key, now, now, len(best_path) - 1, variant, seed,
+                 json.dumps(params, sort_keys=True, default=str),
+                 json.dumps([int(city) for city in best_path]),
+                 float(best_distance),
+                 json.dumps([float(d) for d in iteration_distances]))
+            )
+            # En uzun süredir kullanılmayanları sil
+            conn.execute(
+                "DELETE FROM runs WHERE key IN (SELECT key FROM runs ORDER BY last_used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def list_runs(self, limit=50):
+        """
+        Son kullanılan çalıştırmaları listeler
+
+        Args:
+            limit: En fazla kayıt sayısı
+
+        Returns:
+            list: Her çalıştırma için sözlük (rota ve geçmiş hariç)
+        """
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT key, created_at, last_used_at, hits, n_cities, variant, seed, params, best_distance "
+                "FROM runs ORDER BY last_used_at DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [{
+            'key': key,
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created_at)),
+            'last_used_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_used_at)),
+            'hits': hits,
+            'n_cities': n_cities,
+            'variant': variant,
+            'seed': seed,
+            'params': json.loads(params),
+            'best_distance': best_distance,
+        } for key, created_at, last_used_at, hits, n_cities, variant, seed, params, best_distance in rows]
+
+    def clear(self):
+        """Tüm kayıtları siler"""
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM runs")
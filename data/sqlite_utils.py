@@ -0,0 +1,29 @@
+"""
+SQLite yardımcıları
+Sonuç önbelleği ve adres önbelleği aynı bağlantı yönetimini kullanır
+"""
+import sqlite3
+from contextlib import contextmanager
+
+
+@contextmanager
+def connect(path, timeout=30):
+    """
+    İşlem sonunda commit eden (hata varsa geri alan) ve kapanan bağlantı
+
+    Her çağrı kendi bağlantısını açar; Streamlit oturumları ve iş
+    parçacıkları arasında bağlantı paylaşılmaz.
+
+    Args:
+        path: SQLite dosya yolu
+        timeout: Kilitli veritabanında bekleme süresi (saniye)
+
+    Yields:
+        sqlite3.Connection: Açık bağlantı
+    """
+    conn = sqlite3.connect(path, timeout=timeout)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
@@ -0,0 +1,119 @@
+"""
+Mağaza kümesi veri yapısı
+Koordinatları bitişik (n, 2) float64 dizisinde, id ve isimleri paralel dizilerde tutar
+"""
+import numpy as np
+
+
+class StoreSet:
+    """
+    Sütunsal mağaza kümesi
+
+    Koordinatlar tek bir C-bitişik (n, 2) float64 dizisinde saklanır
+    (sütun 0: enlem, sütun 1: boylam). Mesafe matrisi fonksiyonları,
+    optimizer ve çizim fonksiyonları bu yapıyı dönüşüm yapmadan kullanır;
+    dizi worker süreçlerine kopyalanmadan aktarılabilir.
+    """
+
+    def __init__(self, coords, ids=None, names=None):
+        """
+        Args:
+            coords: (n, 2) şeklinde enlem/boylam dizisi veya [(lat, lon), ...] listesi
+            ids: Mağaza id dizisi (None ise 0..n-1)
+            names: Mağaza isimleri (None ise "Mağaza i")
+        """
+        coords = np.ascontiguousarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Koordinat dizisi (n, 2) şeklinde olmalı")
+
+        n = coords.shape[0]
+        if ids is None:
+            ids = np.arange(n)
+        if names is None:
+            names = [f"Mağaza {i+1}" for i in range(n)]
+
+        self.coords = coords
+        self.ids = np.asarray(ids)
+        self.names = np.asarray(names, dtype=object)
+
+        if len(self.ids) != n or len(self.names) != n:
+            raise ValueError("id/isim sayısı koordinat sayısıyla eşleşmiyor")
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        DataFrame'den mağaza kümesi oluşturur
+
+        Args:
+            df: Mağaza bilgilerini içeren DataFrame
+
+        Returns:
+            StoreSet: Mağaza kümesi
+        """
+        from data.coordinates import get_coordinates_from_dataframe
+
+        names, latitudes, longitudes = get_coordinates_from_dataframe(df)
+        coords = np.empty((len(latitudes), 2), dtype=np.float64)
+        coords[:, 0] = latitudes
+        coords[:, 1] = longitudes
+
+        id_col = next((col for col in df.columns if col.lower() == 'id'), None)
+        ids = df[id_col].values if id_col else None
+
+        return cls(coords, ids=ids, names=names)
+
+    @property
+    def latitudes(self):
+        """Enlem sütunu (kopyasız görünüm)"""
+        return self.coords[:, 0]
+
+    @property
+    def longitudes(self):
+        """Boylam sütunu (kopyasız görünüm)"""
+        return self.coords[:, 1]
+
+    def subset(self, indices):
+        """
+        Verilen indekslerdeki mağazalardan yeni bir küme oluşturur
+
+        Args:
+            indices: Mağaza indeksleri
+
+        Returns:
+            StoreSet: Alt küme
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        return StoreSet(self.coords[indices], self.ids[indices], self.names[indices])
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def __getitem__(self, index):
+        # Eski [(lat, lon), ...] listeleriyle uyumlu: stores[i][0] enlem verir
+        return self.coords[index]
+
+    def __iter__(self):
+        return iter(self.coords)
+
+    def __repr__(self):
+        return f"StoreSet(n={len(self)})"
+
+
+def as_coordinate_array(coordinates):
+    """
+    Koordinatları (n, 2) float64 dizisine çevirir
+
+    StoreSet veya uygun bir ndarray verilirse kopya oluşturulmaz.
+
+    Args:
+        coordinates: StoreSet, (n, 2) dizi veya [(lat, lon), ...] listesi
+
+    Returns:
+        numpy.ndarray: (n, 2) koordinat dizisi
+    """
+    if isinstance(coordinates, StoreSet):
+        return coordinates.coords
+    coords = np.ascontiguousarray(coordinates, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError("Koordinat dizisi (n, 2) şeklinde olmalı")
+    return coords
@@ -8,15 +8,20 @@ import numpy as np
 import pandas as pd
 import os
 import sys
+import time
+from concurrent.futures import CancelledError
 from pathlib import Path
 
 # Proje yollarını ekle
 sys.path.append(str(Path(__file__).parent))
 
-from data.coordinates import load_data_from_drive, get_coordinates_from_dataframe, create_sample_data
-from core.matrix_utils import calculate_distance_matrix_google_maps, calculate_distance_matrix_haversine, get_api_key
-from core.ant_algorithm import AntColonyOptimizer
-from visual.plotting import create_route_map, plot_convergence
+from data.coordinates import load_data_from_drive, create_sample_data, find_coordinate_columns
+from data.geocoding import GeocodeCache, GoogleGeocoder, fill_missing_coordinates
+from data.store_set import StoreSet
+from core.exact import can_solve_exact
+from core.jobs import JobRunner
+from data.result_store import ResultStore, solve_key
+from visual.plotting import create_route_map, plot_convergence, render_convergence
 import config
 
 # Sayfa yapılandırması
@@ -27,6 +32,29 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_result_store():
+    """Tüm oturumların paylaştığı çözüm önbelleği"""
+    return ResultStore(config.RESULT_STORE_PATH, config.RESULT_STORE_MAX_ENTRIES)
+
+@st.cache_resource
+def get_geocode_cache():
+    """Tüm oturumların paylaştığı adres -> koordinat önbelleği"""
+    return GeocodeCache(config.GEOCODE_CACHE_PATH)
+
+@st.cache_resource
+def get_job_runner():
+    """Sunucu süreci boyunca yaşayan, tüm oturumların paylaştığı iş yürütücüsü"""
+    return JobRunner(max_workers=config.JOB_WORKERS)
+
+@st.cache_data(max_entries=8)
+def get_convergence_png(iteration_distances):
+    """Yakınsama grafiğinin PNG verisi (aynı geçmiş için yeniden çizilmez)"""
+    return render_convergence(iteration_distances)
+
+# Çalışan iş varsa sayfa sonunda yeniden çalıştırılarak ilerleme güncellenir
+poll_jobs = False
+
 # Başlık
 st.title("🐜 Karınca Kolonisi Algoritması ile Rota Optimizasyonu")
 st.markdown("### Antalya Muratpaşa Kargo Firması - 20 Mağaza Rota Optimizasyonu")
@@ -34,17 +62,45 @@ st.markdown("### Antalya Muratpaşa Kargo Firması - 20 Mağaza Rota Optimizasyo
 # Sidebar - Parametreler
 st.sidebar.header("⚙️ Algoritma Parametreleri")
 
+# ACO varyantı (parametre kaydırıcıları varyanta göre başlar)
+VARIANT_LABELS = {
+    'as': "Ant System (Temel)",
+    'acs': "Ant Colony System",
+    'mmas': "MAX-MIN Ant System",
+    'rank': "Sıralama Tabanlı AS",
+}
+
+def apply_variant_defaults():
+    """Varyant değişince kaydırıcıları o varyantın önerilen değerlerine getirir"""
+    st.session_state.update(config.variant_defaults(st.session_state.variant))
+
+variant = st.sidebar.selectbox("ACO Varyantı", options=list(VARIANT_LABELS),
+                               index=list(VARIANT_LABELS).index(config.DEFAULT_VARIANT),
+                               format_func=VARIANT_LABELS.get, key='variant',
+                               on_change=apply_variant_defaults,
+                               help="ACS, MMAS ve sıralama tabanlı AS daha az iterasyonda yakınsar; "
+                                    "seçildiğinde parametreler varyantın önerilen değerlerine ayarlanır")
+for setting, value in config.variant_defaults(variant).items():
+    st.session_state.setdefault(setting, value)
+
 # ACO Parametreleri
-n_ants = st.sidebar.slider("Karınca Sayısı", min_value=10, max_value=200, 
-                          value=config.DEFAULT_ANT_COUNT, step=10)
-n_iterations = st.sidebar.slider("İterasyon Sayısı", min_value=10, max_value=500, 
-                                 value=config.DEFAULT_ITERATIONS, step=10)
-alpha = st.sidebar.slider("Alpha (α) - Feromon Önemi", min_value=0.1, max_value=5.0, 
-                         value=config.DEFAULT_ALPHA, step=0.1)
-beta = st.sidebar.slider("Beta (β) - Mesafe Önemi", min_value=0.1, max_value=5.0, 
-                        value=config.DEFAULT_BETA, step=0.1)
-evaporation_rate = st.sidebar.slider("Buharlaşma Oranı", min_value=0.1, max_value=0.9, 
-                                    value=config.DEFAULT_EVAPORATION_RATE, step=0.05)
+def parameter_slider(label, setting):
+    """config.PARAMETER_RANGES aralığında, değeri oturum durumunda tutulan kaydırıcı"""
+    low, high, step = config.PARAMETER_RANGES[setting]
+    return st.sidebar.slider(label, min_value=low, max_value=high, step=step, key=setting)
+
+n_ants = parameter_slider("Karınca Sayısı", 'DEFAULT_ANT_COUNT')
+n_iterations = parameter_slider("İterasyon Sayısı", 'DEFAULT_ITERATIONS')
+alpha = parameter_slider("Alpha (α) - Feromon Önemi", 'DEFAULT_ALPHA')
+beta = parameter_slider("Beta (β) - Mesafe Önemi", 'DEFAULT_BETA')
+evaporation_rate = parameter_slider("Buharlaşma Oranı", 'DEFAULT_EVAPORATION_RATE')
+target_gap_pct = st.sidebar.number_input("Hedef Optimallik Açığı (%)", min_value=0.0, max_value=50.0,
+                                         value=(config.DEFAULT_TARGET_GAP or 0.0) * 100, step=0.5,
+                                         help="En iyi rota alt sınırın bu kadar yakınına gelince durulur (0: kapalı; "
+                                              f"{config.LOW_MEMORY_THRESHOLD} noktanın üstünde kullanılmaz)")
+use_exact = st.sidebar.checkbox("Küçük örneklerde kesin çözüm", value=True,
+                                help=f"{config.EXACT_MAX_CITIES} noktaya kadar ACO yerine Held-Karp ile optimum "
+                                     "rota bulunur; ACO parametreleri bu durumda kullanılmaz")
 
 # Google Maps API Key girişi
 st.sidebar.header("🔑 API Ayarları")
@@ -60,7 +116,8 @@ data_source = st.sidebar.radio(
 )
 
 # Ana içerik
-tab1, tab2, tab3 = st.tabs(["🗺️ Harita ve Rota", "📈 Yakınsama Grafiği", "ℹ️ Bilgiler"])
+tab1, tab2, tab3, tab4 = st.tabs(["🗺️ Harita ve Rota", "📈 Yakınsama Grafiği", "ℹ️ Bilgiler",
+                                  "🗂️ Geçmiş Çalıştırmalar"])
 
 with tab1:
     st.header("Rota Optimizasyonu")
@@ -81,86 +138,200 @@ with tab1:
                 else:
                     df = create_sample_data()
                 
-                names, latitudes, longitudes = get_coordinates_from_dataframe(df)
-                coordinates = list(zip(latitudes, longitudes))
+                # Koordinatı eksik mağazalar adres sütunundan çözümlenir (önbellekli)
+                lat_col, lon_col = find_coordinate_columns(df)
+                if lat_col is None or lon_col is None or df[[lat_col, lon_col]].isna().any().any():
+                    # Önce sadece önbellek; ağ üzerinden çözümleyici yalnızca eksik kalırsa oluşturulur
+                    df = fill_missing_coordinates(df, None, cache=get_geocode_cache())
+                    lat_col, lon_col = find_coordinate_columns(df)
+                    unresolved = df[[lat_col, lon_col]].isna().any(axis=1)
+                    if unresolved.any():
+                        try:
+                            geocoder = GoogleGeocoder(api_key_input or None)
+                        except (ValueError, ImportError) as e:
+                            st.warning(f"⚠️ Adres çözümleme kullanılamıyor ({e}); sadece önbellekteki adresler kullanıldı")
+                        else:
+                            df = fill_missing_coordinates(df, geocoder, cache=get_geocode_cache())
+                            unresolved = df[[lat_col, lon_col]].isna().any(axis=1)
+                    if unresolved.any():
+                        st.warning(f"⚠️ {int(unresolved.sum())} mağazanın adresi çözümlenemedi, listeden çıkarıldı")
+                        df = df[~unresolved].reset_index(drop=True)
+                
+                stores = StoreSet.from_dataframe(df)
                 
                 st.session_state.df = df
-                st.session_state.coordinates = coordinates
-                st.session_state.names = names
+                st.session_state.coordinates = stores
+                st.session_state.names = stores.names
                 st.session_state.data_loaded = True
                 
-                st.success(f"✅ {len(coordinates)} nokta yüklendi!")
+                st.success(f"✅ {len(stores)} nokta yüklendi!")
                 st.dataframe(df.head(10))
                 
             except Exception as e:
                 st.error(f"Veri yükleme hatası: {e}")
                 st.info("Örnek veri kullanılıyor...")
                 df = create_sample_data()
-                names, latitudes, longitudes = get_coordinates_from_dataframe(df)
-                coordinates = list(zip(latitudes, longitudes))
+                stores = StoreSet.from_dataframe(df)
                 st.session_state.df = df
-                st.session_state.coordinates = coordinates
-                st.session_state.names = names
+                st.session_state.coordinates = stores
+                st.session_state.names = stores.names
                 st.session_state.data_loaded = True
     
+    # Arka plan işleri (sayfa yeniden çalıştırmalarında iş kimliğiyle takip edilir)
+    if 'matrix_job' not in st.session_state:
+        st.session_state.matrix_job = None
+        st.session_state.solve_job = None
+    runner = get_job_runner()
+    
     # Mesafe matrisi hesaplama
     if st.session_state.data_loaded and st.session_state.distance_matrix is None:
-        if st.button("📏 Mesafe Matrisini Hesapla"):
-            with st.spinner("Mesafe matrisi hesaplanıyor (bu işlem biraz zaman alabilir)..."):
+        if st.session_state.matrix_job is None:
+            if st.button("📏 Mesafe Matrisini Hesapla"):
+                if not api_key_input:
+                    st.info("API key girilmedi. Haversine formülü kullanılıyor...")
+                # Büyük örneklerde float32 ve parça parça matris oluşturma
+                low_memory = len(st.session_state.coordinates) > config.LOW_MEMORY_THRESHOLD
+                st.session_state.matrix_job = runner.submit_matrix(
+                    st.session_state.coordinates, api_key=api_key_input or None, low_memory=low_memory
+                )
+        
+        job_id = st.session_state.matrix_job
+        if job_id is not None:
+            status = runner.status(job_id)
+            if status in ('pending', 'running'):
+                st.info("⏳ Mesafe matrisi hesaplanıyor (bu işlem biraz zaman alabilir)...")
+                if st.button("⛔ Matris Hesaplamayı İptal Et"):
+                    runner.cancel(job_id)
+                poll_jobs = True
+            else:
                 try:
-                    # API key kontrolü
-                    if api_key_input:
-                        os.environ['GOOGLE_MAPS_API_KEY'] = api_key_input
-                        client = None
-                        try:
-                            from core.matrix_utils import initialize_google_maps_client
-                            client = initialize_google_maps_client()
-                            distance_matrix, duration_matrix = calculate_distance_matrix_google_maps(
-                                st.session_state.coordinates, client
-                            )
-                            st.success("✅ Google Maps API ile mesafe matrisi oluşturuldu!")
-                        except Exception as e:
-                            st.warning(f"Google Maps API hatası: {e}. Haversine formülü kullanılıyor...")
-                            from core.matrix_utils import calculate_distance_matrix_haversine
-                            distance_matrix = calculate_distance_matrix_haversine(st.session_state.coordinates)
+                    if status == 'cancelled':
+                        st.warning("Mesafe matrisi hesaplaması iptal edildi.")
                     else:
-                        st.info("API key girilmedi. Haversine formülü kullanılıyor...")
-                        from core.matrix_utils import calculate_distance_matrix_haversine
-                        distance_matrix = calculate_distance_matrix_haversine(st.session_state.coordinates)
-                    
-                    st.session_state.distance_matrix = distance_matrix
-                    st.success("✅ Mesafe matrisi hazır!")
-                    
+                        distance_matrix, source, api_error = runner.result(job_id)
+                        if api_error:
+                            st.warning(f"Google Maps API hatası: {api_error}. Haversine formülü kullanıldı.")
+                        elif source == 'google':
+                            st.success("✅ Google Maps API ile mesafe matrisi oluşturuldu!")
+                        
+                        st.session_state.distance_matrix = distance_matrix
+                        st.success("✅ Mesafe matrisi hazır!")
                 except Exception as e:
                     st.error(f"Mesafe matrisi hesaplama hatası: {e}")
+                finally:
+                    runner.forget(job_id)
+                    st.session_state.matrix_job = None
     
     # ACO algoritmasını çalıştır
     if st.session_state.data_loaded and st.session_state.distance_matrix is not None:
-        if st.button("🚀 ACO Algoritmasını Çalıştır", type="primary"):
-            with st.spinner("ACO algoritması çalışıyor..."):
-                try:
-                    # ACO optimizer oluştur
-                    optimizer = AntColonyOptimizer(
-                        distance_matrix=st.session_state.distance_matrix,
-                        n_ants=n_ants,
-                        n_iterations=n_iterations,
-                        alpha=alpha,
-                        beta=beta,
-                        evaporation_rate=evaporation_rate
+        if st.session_state.solve_job is None and st.button("🚀 ACO Algoritmasını Çalıştır", type="primary"):
+            try:
+                params = {
+                    'n_ants': n_ants,
+                    'n_iterations': n_iterations,
+                    'alpha': alpha,
+                    'beta': beta,
+                    'evaporation_rate': evaporation_rate,
+                }
+                # Alt sınır büyük örneklerde (düşük bellek modu) hesaplanmaz
+                large = len(st.session_state.distance_matrix) > config.LOW_MEMORY_THRESHOLD
+                if target_gap_pct > 0 and not large:
+                    params['target_gap'] = target_gap_pct / 100
+                elif target_gap_pct > 0:
+                    st.info(f"ℹ️ {config.LOW_MEMORY_THRESHOLD} noktanın üstünde optimallik açığı hesaplanmaz, "
+                            "hedef açık kullanılmayacak")
+                if not use_exact:
+                    params['exact_threshold'] = 0
+                
+                # Kesin çözüm ACO parametrelerine bağlı değildir: anahtar sadece matrise göre
+                method = ('exact' if use_exact and can_solve_exact(len(st.session_state.distance_matrix))
+                          else 'aco')
+                if method == 'exact':
+                    key_params, key_variant = {'method': 'exact'}, 'exact'
+                    st.info("🎯 Küçük örnek: ACO yerine Held-Karp ile kesin çözüm kullanılıyor "
+                            "(ACO parametreleri etkisiz)")
+                else:
+                    key_params, key_variant = params, variant
+                
+                # Aynı istek daha önce çözüldüyse önbellekten al
+                result_store = get_result_store()
+                key = solve_key(st.session_state.distance_matrix, key_params, key_variant)
+                cached = result_store.get(key)
+                
+                if cached is not None:
+                    best_path, best_distance, iteration_distances = cached
+                    st.session_state.best_path = best_path
+                    st.session_state.best_distance = best_distance
+                    st.session_state.iteration_distances = iteration_distances
+                    st.session_state.certified_gap = 0.0 if method == 'exact' else None
+                    st.session_state.solve_method = method
+                    st.info("♻️ Aynı veri ve parametrelerle önceki sonuç kullanıldı")
+                    st.success(f"✅ Algoritma tamamlandı! En kısa rota: {best_distance:.2f} km")
+                else:
+                    solver_params = dict(
+                        params,
+                        low_memory=st.session_state.distance_matrix.dtype == np.float32,
+                        candidate_k=(config.DEFAULT_CANDIDATE_K
+                                     if large else None)
+                    )
+                    # Yarıda kalan aynı istek (iptal, worker yeniden başlaması) kaldığı yerden sürer
+                    st.session_state.solve_job = runner.submit_solve(
+                        st.session_state.distance_matrix, solver_params, variant=variant, start_city=0,
+                        checkpoint_path=os.path.join(config.CHECKPOINT_DIR, f"{key}.npz")
                     )
+                    st.session_state.solve_request = (key, key_params, key_variant)
+                    
+            except Exception as e:
+                st.error(f"Algoritma hatası: {e}")
+        
+        job_id = st.session_state.solve_job
+        if job_id is not None:
+            status = runner.status(job_id)
+            if status in ('pending', 'running'):
+                progress = runner.progress(job_id)
+                if progress.get('method') == 'exact':
+                    st.info("🎯 Held-Karp ile kesin çözüm hesaplanıyor...")
+                elif progress.get('stage') == 'solve':
+                    st.progress(progress['iteration'] / progress['total'],
+                                text=f"ACO algoritması çalışıyor... İterasyon {progress['iteration']}/{progress['total']}, "
+                                     f"en iyi mesafe: {progress['best_distance']:.2f} km"
+                                     + (f", açık: %{progress['gap'] * 100:.2f}" if progress.get('gap') is not None else ""))
+                else:
+                    st.info("⏳ ACO algoritması sırada bekliyor...")
+                if st.button("⛔ Algoritmayı Durdur"):
+                    runner.cancel(job_id)
+                poll_jobs = True
+            else:
+                try:
+                    best_path, best_distance, iteration_distances = runner.result(job_id)
+                    st.session_state.certified_gap = runner.progress(job_id).get('gap')
+                    st.session_state.solve_method = runner.progress(job_id).get('method')
                     
-                    # Algoritmayı çalıştır
-                    best_path, best_distance, iteration_distances = optimizer.solve(start_city=0)
+                    # Sadece tamamlanan çalıştırmalar önbelleğe yazılır
+                    if status == 'done':
+                        key, params, run_variant = st.session_state.solve_request
+                        get_result_store().put(key, (best_path, best_distance, iteration_distances),
+                                               params, run_variant)
+                        checkpoint_path = os.path.join(config.CHECKPOINT_DIR, f"{key}.npz")
+                        if os.path.exists(checkpoint_path):
+                            os.remove(checkpoint_path)
+                        st.success(f"✅ Algoritma tamamlandı! En kısa rota: {best_distance:.2f} km")
+                    else:
+                        st.warning(f"Algoritma durduruldu. O ana kadarki en kısa rota: {best_distance:.2f} km")
                     
                     # Sonuçları session state'e kaydet
                     st.session_state.best_path = best_path
                     st.session_state.best_distance = best_distance
                     st.session_state.iteration_distances = iteration_distances
                     
-                    st.success(f"✅ Algoritma tamamlandı! En kısa rota: {best_distance:.2f} km")
-                    
+                except CancelledError:
+                    # Sırada beklerken iptal edilen işin sonucu yoktur
+                    st.warning("Algoritma başlamadan iptal edildi.")
                 except Exception as e:
                     st.error(f"Algoritma hatası: {e}")
+                finally:
+                    runner.forget(job_id)
+                    st.session_state.solve_job = None
     
     # Sonuçları göster
     if 'best_path' in st.session_state and st.session_state.best_path is not None:
@@ -180,7 +351,12 @@ with tab1:
         
         with col2:
             st.metric("Toplam Mesafe", f"{st.session_state.best_distance:.2f} km")
+            st.metric("Yöntem", "Kesin (Held-Karp)" if st.session_state.get('solve_method') == 'exact'
+                      else "ACO")
             st.metric("Ziyaret Edilen Nokta", len(st.session_state.best_path) - 1)
+            if st.session_state.get('certified_gap') is not None:
+                st.metric("Garanti Edilen Açık", f"%{st.session_state.certified_gap * 100:.2f}",
+                          help="En iyi rotanın Held-Karp alt sınırına göre optimumdan en fazla uzaklığı")
             
             # Rota detayları
             st.subheader("Rota Sırası")
@@ -197,24 +373,16 @@ with tab1:
 with tab2:
     st.header("Yakınsama Grafiği")
     
-    if 'iteration_distances' in st.session_state and st.session_state.iteration_distances:
-        # Grafik oluştur
-        fig = plot_convergence(st.session_state.iteration_distances)
-        
-        # Streamlit'te göster
-        import matplotlib.pyplot as plt
-        plt.figure(figsize=(10, 6))
-        plt.plot(range(1, len(st.session_state.iteration_distances) + 1), 
-                st.session_state.iteration_distances, 
-                linewidth=2, color='blue', marker='o', markersize=3)
-        plt.xlabel('İterasyon', fontsize=12, fontweight='bold')
-        plt.ylabel('En İyi Mesafe (km)', fontsize=12, fontweight='bold')
-        plt.title('ACO Algoritması Yakınsama Grafiği', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
+    if st.session_state.get('solve_method') == 'exact' and st.session_state.get('best_path') is not None:
+        st.info("🎯 Rota Held-Karp ile kesin olarak çözüldü; iterasyon olmadığından yakınsama grafiği yok.")
+    elif 'iteration_distances' in st.session_state and st.session_state.iteration_distances:
+        # Grafik bellekte bir kez çizilir; diske sadece dışa aktarımda yazılır
+        st.image(get_convergence_png(tuple(st.session_state.iteration_distances)))
         
-        st.pyplot(plt)
-        plt.close()
+        if st.button("💾 Grafiği Dışa Aktar"):
+            save_path = plot_convergence(st.session_state.iteration_distances,
+                                         save_path=config.CONVERGENCE_EXPORT_PATH)
+            st.success(f"✅ Grafik kaydedildi: {save_path}")
         
         # İstatistikler
         col1, col2, col3, col4 = st.columns(4)
@@ -276,6 +444,26 @@ with tab3:
     else:
         st.warning("⚠️ Mesafe matrisi henüz hesaplanmadı")
 
+with tab4:
+    st.header("Geçmiş Çalıştırmalar")
+    
+    runs = get_result_store().list_runs()
+    if runs:
+        st.dataframe(pd.DataFrame([{
+            'Son Kullanım': run['last_used_at'],
+            'Nokta': run['n_cities'],
+            'Varyant': run['variant'],
+            'Parametreler': ', '.join(f"{k}={v}" for k, v in run['params'].items()),
+            'En İyi Mesafe (km)': round(run['best_distance'], 2),
+            'Tekrar Kullanım': run['hits'],
+        } for run in runs]))
+        
+        if st.button("🗑️ Önbelleği Temizle"):
+            get_result_store().clear()
+            st.rerun()
+    else:
+        st.info("Henüz kaydedilmiş çalıştırma yok.")
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📝 Notlar")
@@ -284,4 +472,6 @@ st.sidebar.info(
     "API key olmadan Haversine formülü kullanılacaktır."
 )
 
-
+if poll_jobs:
+    time.sleep(config.JOB_POLL_INTERVAL)
+    st.rerun()
@@ -2,17 +2,20 @@
 Görselleştirme fonksiyonları
 Harita çizimi ve grafik oluşturma
 """
+import io
+import os
 import folium
 import matplotlib.pyplot as plt
 import numpy as np
 from streamlit_folium import st_folium
+from data.store_set import as_coordinate_array
 
 def create_route_map(coordinates, path, names, best_distance):
     """
     Folium haritası üzerinde rotayı çizer
     
     Args:
-        coordinates: [(lat, lon), ...] formatında koordinat listesi
+        coordinates: StoreSet, (n, 2) dizi veya [(lat, lon), ...] listesi
         path: Şehir ziyaret sırası (indeks listesi)
         names: Şehir/mağaza isimleri
         best_distance: En iyi mesafe (km)
@@ -20,9 +23,10 @@ def create_route_map(coordinates, path, names, best_distance):
     Returns:
         folium.Map: Harita nesnesi
     """
+    coords = as_coordinate_array(coordinates)
+    
     # Harita merkezini belirle
-    center_lat = np.mean([coord[0] for coord in coordinates])
-    center_lon = np.mean([coord[1] for coord in coordinates])
+    center_lat, center_lon = coords.mean(axis=0)
     
     # Harita oluştur
     m = folium.Map(
@@ -32,7 +36,7 @@ def create_route_map(coordinates, path, names, best_distance):
     )
     
     # Rota çizgisi için koordinatlar
-    route_coords = [coordinates[i] for i in path]
+    route_coords = coords[np.asarray(path)].tolist()
     
     # Rota çizgisini ekle
     folium.PolyLine(
@@ -43,8 +47,11 @@ def create_route_map(coordinates, path, names, best_distance):
         popup=f'En Kısa Rota: {best_distance:.2f} km'
     ).add_to(m)
     
+    # Her noktanın rotadaki sırası
+    visit_order = {city: order for order, city in reversed(list(enumerate(path)))}
+    
     # Her noktayı işaretle
-    for i, (coord, name) in enumerate(zip(coordinates, names)):
+    for i, (coord, name) in enumerate(zip(coords.tolist(), names)):
         # Başlangıç noktası (depo) farklı renkte
         if i == path[0]:
             color = 'red'
@@ -53,7 +60,7 @@ def create_route_map(coordinates, path, names, best_distance):
         else:
             color = 'green'
             icon = 'shopping-cart'
-            popup_text = f'<b>{name}</b><br>Sıra: {path.index(i) if i in path else "N/A"}'
+            popup_text = f'<b>{name}</b><br>Sıra: {visit_order.get(i, "N/A")}'
         
         folium.Marker(
             location=coord,
@@ -72,41 +79,135 @@ def create_route_map(coordinates, path, names, best_distance):
     
     return m
 
-def plot_convergence(iteration_distances, save_path='figure/convergence.png'):
+def lttb_downsample(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets ile seriyi seyreltir
+    
+    İlk ve son nokta korunur; aradaki her kovadan, önceki seçilen nokta ve
+    sonraki kovanın ortalamasıyla en büyük üçgeni oluşturan nokta seçilir.
+    Böylece eğrinin görsel şekli (kırılmalar, sıçramalar) korunur.
+    
+    Args:
+        x: X değerleri
+        y: Y değerleri
+        n_out: Çıktı nokta sayısı
+    
+    Returns:
+        numpy.ndarray: Seçilen x değerleri
+        numpy.ndarray: Seçilen y değerleri
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # İç noktalar n_out - 2 kovaya bölünür
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Sonraki kovanın ortalaması (son kovada son nokta)
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        area = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    
+    return x[selected], y[selected]
+
+def convergence_figure(iteration_distances, max_points=None):
+    """
+    Yakınsama grafiğini pyplot durumuna dokunmadan oluşturur
+    
+    Uzun geçmişler ekran çözünürlüğüne göre LTTB ile seyreltilir; işaretçiler
+    sadece az noktalı seriler için çizilir.
+    
+    Args:
+        iteration_distances: Her iterasyondaki en iyi mesafe listesi
+        max_points: Çizilecek en fazla nokta (None ise config.CONVERGENCE_MAX_POINTS)
+    
+    Returns:
+        matplotlib.figure.Figure: Grafik
+    """
+    from matplotlib.figure import Figure
+    
+    if max_points is None:
+        from config import CONVERGENCE_MAX_POINTS
+        max_points = CONVERGENCE_MAX_POINTS
+    
+    iterations, distances = lttb_downsample(np.arange(1, len(iteration_distances) + 1),
+                                            iteration_distances, max_points)
+    
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    marker = 'o' if len(distances) <= 100 else None
+    ax.plot(iterations, distances, linewidth=2, color='blue', marker=marker, markersize=3)
+    ax.set_xlabel('İterasyon', fontsize=12, fontweight='bold')
+    ax.set_ylabel('En İyi Mesafe (km)', fontsize=12, fontweight='bold')
+    ax.set_title('ACO Algoritması Yakınsama Grafiği', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+def render_convergence(iteration_distances, dpi=100, max_points=None):
+    """
+    Yakınsama grafiğini bellekte PNG olarak çizer (diske yazmaz)
+    
+    Args:
+        iteration_distances: Her iterasyondaki en iyi mesafe listesi
+        dpi: Çözünürlük
+        max_points: Çizilecek en fazla nokta
+    
+    Returns:
+        bytes: PNG verisi
+    """
+    buffer = io.BytesIO()
+    convergence_figure(iteration_distances, max_points).savefig(buffer, format='png', dpi=dpi)
+    return buffer.getvalue()
+
+def plot_convergence(iteration_distances, save_path='figure/convergence.png', dpi=300):
     """
-    İterasyonlara göre mesafe değişimini grafikle gösterir
+    Yakınsama grafiğini dosyaya aktarır (tüm iterasyonlar, seyreltme yok)
     
     Args:
         iteration_distances: Her iterasyondaki en iyi mesafe listesi
         save_path: Grafik kayıt yolu
+        dpi: Çözünürlük
+    
+    Returns:
+        str: Kaydedilen dosya yolu
     """
-    plt.figure(figsize=(10, 6))
-    plt.plot(range(1, len(iteration_distances) + 1), iteration_distances, 
-             linewidth=2, color='blue', marker='o', markersize=3)
-    plt.xlabel('İterasyon', fontsize=12, fontweight='bold')
-    plt.ylabel('En İyi Mesafe (km)', fontsize=12, fontweight='bold')
-    plt.title('ACO Algoritması Yakınsama Grafiği', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
+    fig = convergence_figure(iteration_distances, max_points=len(iteration_distances))
     
     # Grafik kaydet
-    import os
     os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
     
-    return plt
+    return save_path
 
 def plot_route_comparison(coordinates, paths, distances, names):
     """
     Birden fazla rotayı karşılaştırmalı gösterir
     
     Args:
-        coordinates: Koordinat listesi
+        coordinates: StoreSet, (n, 2) dizi veya koordinat listesi
         paths: Rota listesi (her biri bir çözüm)
         distances: Mesafe listesi
         names: Şehir isimleri
     """
+    coords = as_coordinate_array(coordinates)
+    
     fig, axes = plt.subplots(1, len(paths), figsize=(15, 5))
     if len(paths) == 1:
         axes = [axes]
@@ -115,9 +216,9 @@ def plot_route_comparison(coordinates, paths, distances, names):
         ax = axes[idx]
         
         # Koordinatları çiz
-        route_coords = [coordinates[i] for i in path]
-        lats = [coord[0] for coord in route_coords]
-        lons = [coord[1] for coord in route_coords]
+        route_coords = coords[np.asarray(path)]
+        lats = route_coords[:, 0]
+        lons = route_coords[:, 1]
         
         ax.plot(lons, lats, 'o-', linewidth=2, markersize=8, label='Rota')
         ax.scatter(lons[0], lats[0], c='red', s=200, marker='s', 